@@ -12,6 +12,9 @@ from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.theme import Theme
+from textual.timer import Timer
+from textual.widget import Widget
+from textual.widgets import Static
 
 from lazyclaude import __version__
 from lazyclaude.bindings import APP_BINDINGS
@@ -22,6 +25,7 @@ from lazyclaude.mixins import (
     MarketplaceMixin,
     NavigationMixin,
 )
+from lazyclaude.mixins.filtering import LEVEL_FILTER_LABELS
 from lazyclaude.models.customization import (
     ConfigLevel,
     Customization,
@@ -76,6 +80,8 @@ class LazyClaude(
         CustomizationType.MEMORY_FILE,
     )
     _PROJECT_LOCAL_TYPES = (CustomizationType.HOOK, CustomizationType.MCP)
+    _FILTER_DEBOUNCE_SECONDS = 0.08
+    _FILTER_CACHE_SIZE = 16
 
     def __init__(
         self,
@@ -92,11 +98,18 @@ class LazyClaude(
             project_config_path=project_config_path,
         )
         self._filter_service = FilterService()
+        self._editor_command: list[str] | None = None
         self._customizations: list[Customization] = []
+        self._by_level: dict[ConfigLevel, list[Customization]] = {}
         self._level_filter: ConfigLevel | None = None
         self._search_query: str = ""
+        self._filter_timer: Timer | None = None
         self._plugin_enabled_filter: bool | None = True
+        self._filter_cache: dict[
+            tuple[str, ConfigLevel | None, bool | None], list[Customization]
+        ] = {}
         self._panels: list[TypePanel] = []
+        self._panel_items: dict[TypePanel | CombinedPanel, list[Customization]] = {}
         self._combined_panel: CombinedPanel | None = None
         self._status_panel: StatusPanel | None = None
         self._main_pane: MainPane | None = None
@@ -109,9 +122,11 @@ class LazyClaude(
         self._marketplace_source_input: MarketplaceSourceInput | None = None
         self._marketplace_loader: MarketplaceLoader | None = None
         self._app_footer: AppFooter | None = None
-        self._help_visible = False
+        self._help_widget: Static | None = None
         self._last_focused_panel: TypePanel | None = None
         self._last_focused_combined: bool = False
+        self._focused_panel_index: int | None = None
+        self._panel_indices: dict[Widget, int] = {}
         self._pending_customization: Customization | None = None
         self._panel_before_selector: TypePanel | None = None
         self._combined_before_selector: bool = False
@@ -184,6 +199,7 @@ class LazyClaude(
         self._settings = self._settings_service.load()
         self.theme = self._settings.theme
         self.theme_changed_signal.subscribe(self, self._on_theme_changed)
+        self._index_panels()
         self._load_customizations()
         self._update_status_panel()
         self._update_footer_actions()
@@ -193,11 +209,11 @@ class LazyClaude(
         if os.name == "nt":
             os.system(f"title {self.title}")
         self._config_path_resolver = ConfigPathResolver(
-            self._discovery_service._plugin_loader,
+            self._discovery_service.plugin_loader,
         )
         self._marketplace_loader = MarketplaceLoader(
             user_config_path=self._discovery_service.user_config_path,
-            plugin_loader=self._discovery_service._plugin_loader,
+            plugin_loader=self._discovery_service.plugin_loader,
         )
         if self._marketplace_modal:
             self._marketplace_modal.set_loader(self._marketplace_loader)
@@ -228,10 +244,7 @@ class LazyClaude(
             return self._plugin_preview_mode
 
         marketplace_blocked_actions = {
-            "filter_all",
-            "filter_user",
-            "filter_project",
-            "filter_plugin",
+            "filter_level",
             "toggle_plugin_enabled_filter",
         }
         if (
@@ -249,13 +262,7 @@ class LazyClaude(
                 "copy_config_path",
                 "focus_next_panel",
                 "focus_previous_panel",
-                "focus_panel_1",
-                "focus_panel_2",
-                "focus_panel_3",
-                "focus_panel_4",
-                "focus_panel_5",
-                "focus_panel_6",
-                "focus_panel_7",
+                "focus_panel",
                 "focus_main_pane",
                 "prev_view",
                 "next_view",
@@ -301,8 +308,14 @@ class LazyClaude(
     def _load_customizations(self) -> None:
         """Load customizations from discovery service."""
         self._customizations = self._discovery_service.discover_all()
+        self._reindex_customizations()
         self._update_panels()
 
+    def _reindex_customizations(self) -> None:
+        """Rebuild per-level buckets and drop memoized filter results."""
+        self._by_level = self._filter_service.group_by_level(self._customizations)
+        self._filter_cache.clear()
+
     def _update_panels(self) -> None:
         """Update all panels with filtered customizations."""
         if self._plugin_preview_mode:
@@ -314,19 +327,61 @@ class LazyClaude(
             )
         else:
             customizations = self._get_filtered_customizations()
+
+        by_type: dict[CustomizationType, list[Customization]] = {
+            ctype: [] for ctype in CustomizationType
+        }
+        for c in customizations:
+            by_type[c.type].append(c)
+
         for panel in self._panels:
-            panel.set_customizations(customizations)
+            items = by_type[panel.customization_type]
+            if self._panel_items_changed(panel, items):
+                panel.set_customizations(items)
         if self._combined_panel:
-            self._combined_panel.set_customizations(customizations)
+            combined = [c for t in CombinedPanel.COMBINED_TYPES for c in by_type[t]]
+            if self._panel_items_changed(self._combined_panel, combined):
+                self._combined_panel.set_customizations(combined, by_type=by_type)
+
+    def _panel_items_changed(
+        self, panel: TypePanel | CombinedPanel, items: list[Customization]
+    ) -> bool:
+        """Record a panel's new items, reporting whether it needs a rebuild."""
+        previous = self._panel_items.get(panel)
+        if (
+            previous is not None
+            and len(previous) == len(items)
+            and all(a is b for a, b in zip(previous, items, strict=True))
+        ):
+            # Callers clear the main pane before updating, so the focused panel
+            # must still re-announce its selection.
+            if panel.is_active:
+                panel.reemit_selection()
+            return False
+        self._panel_items[panel] = items
+        return True
 
     def _get_filtered_customizations(self) -> list[Customization]:
         """Get customizations filtered by current level and search query."""
-        return self._filter_service.filter(
-            self._customizations,
+        key = (self._search_query, self._level_filter, self._plugin_enabled_filter)
+        cached = self._filter_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self._level_filter is None:
+            source = self._customizations
+        else:
+            source = self._by_level.get(self._level_filter, [])
+        result = self._filter_service.filter(
+            source,
             query=self._search_query,
-            level=self._level_filter,
+            level=None,
             plugin_enabled=self._plugin_enabled_filter,
         )
+        if len(self._filter_cache) >= self._FILTER_CACHE_SIZE:
+            del self._filter_cache[next(iter(self._filter_cache))]
+        self._filter_cache[key] = result
+        return result
 
     def _update_display_path(self, customization: Customization | None) -> None:
         """Update main pane display path with resolved path for plugins."""
@@ -346,15 +401,10 @@ class LazyClaude(
             self.sub_title = f"Preview: {self._previewing_plugin.name} | Esc to exit"
             return
 
-        parts = []
-        if self._level_filter == ConfigLevel.USER:
-            parts.append("User Level")
-        elif self._level_filter == ConfigLevel.PROJECT:
-            parts.append("Project Level")
-        elif self._level_filter == ConfigLevel.PLUGIN:
-            parts.append("Plugin Level")
-        else:
-            parts.append("All Levels")
+        _, level_label = LEVEL_FILTER_LABELS.get(
+            self._level_filter, LEVEL_FILTER_LABELS[None]
+        )
+        parts = [level_label]
 
         if self._plugin_enabled_filter is True:
             parts.append("Enabled Only")
@@ -509,14 +559,30 @@ class LazyClaude(
             self._status_panel.search_active = search_active
         if self._app_footer:
             self._app_footer.search_active = search_active
+        # Coalesce bursts of keystrokes into a single filter pass and redraw.
+        self._cancel_pending_filter()
+        self._filter_timer = self.set_timer(
+            self._FILTER_DEBOUNCE_SECONDS, self._apply_pending_filter
+        )
+
+    def _apply_pending_filter(self) -> None:
+        """Apply the debounced search query to the panels."""
+        self._filter_timer = None
         self._update_panels()
         self._update_subtitle()
 
+    def _cancel_pending_filter(self) -> None:
+        """Stop a scheduled debounced filter pass, if any."""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+            self._filter_timer = None
+
     def on_filter_input_filter_cancelled(
         self,
         message: FilterInput.FilterCancelled,  # noqa: ARG002
     ) -> None:
         """Handle filter cancellation."""
+        self._cancel_pending_filter()
         self._search_query = ""
         self._last_focused_panel = None
         if self._main_pane:
@@ -534,6 +600,9 @@ class LazyClaude(
         message: FilterInput.FilterApplied,  # noqa: ARG002
     ) -> None:
         """Handle filter application (Enter key)."""
+        if self._filter_timer is not None:
+            self._cancel_pending_filter()
+            self._apply_pending_filter()
         if self._filter_input:
             self._filter_input.hide()
         self.refresh_bindings()
@@ -547,6 +616,7 @@ class LazyClaude(
     def action_refresh(self) -> None:
         """Refresh customizations from disk."""
         self._customizations = self._discovery_service.refresh()
+        self._reindex_customizations()
         self._update_panels()
 
     def action_open_in_editor(self) -> None:
@@ -571,9 +641,7 @@ class LazyClaude(
         if not file_path.exists():
             return
 
-        editor = os.environ.get("EDITOR", "vi")
-        cmd = shlex.split(editor) + [str(file_path)]
-        subprocess.Popen(cmd, shell=(sys.platform == "win32"))
+        self._launch_editor([file_path])
 
     def _open_paths_in_editor(self, paths: list[Path]) -> None:
         """Open paths in $EDITOR with error handling."""
@@ -582,8 +650,19 @@ class LazyClaude(
             self.notify("No valid paths to open", severity="warning")
             return
 
-        editor = os.environ.get("EDITOR", "vi")
-        cmd = shlex.split(editor) + [str(p) for p in valid_paths]
+        self._launch_editor(valid_paths)
+
+    def _launch_editor(self, paths: list[Path]) -> None:
+        """Start $EDITOR on paths without waiting for it to exit."""
+        if self._editor_command is None:
+            # Parsed on first use so a malformed $EDITOR only breaks editing.
+            try:
+                self._editor_command = shlex.split(os.environ.get("EDITOR", "vi"))
+            except ValueError as e:
+                self.notify(f"Invalid $EDITOR: {e}", severity="error")
+                return
+        cmd = [*self._editor_command, *(str(p) for p in paths)]
+        # Windows needs the shell to resolve editors installed as .cmd shims.
         subprocess.Popen(cmd, shell=(sys.platform == "win32"))
 
     def action_open_user_config(self) -> None:
@@ -626,9 +705,9 @@ class LazyClaude(
 
     def _get_focused_panel(self) -> TypePanel | None:
         """Get the currently focused TypePanel (not combined panel)."""
-        for panel in self._panels:
-            if panel.has_focus:
-                return panel
+        index = self._get_focused_panel_index()
+        if index is not None and index < len(self._panels):
+            return self._panels[index]
         return None
 
     def _is_skill_subfile_selected(self) -> bool:
@@ -13,6 +13,20 @@ if TYPE_CHECKING:
     from lazyclaude.widgets.type_panel import TypePanel
 
 
+# Level filter -> (status/footer label, subtitle label).
+LEVEL_FILTER_LABELS: dict[ConfigLevel | None, tuple[str, str]] = {
+    None: ("All", "All Levels"),
+    ConfigLevel.USER: ("User", "User Level"),
+    ConfigLevel.PROJECT: ("Project", "Project Level"),
+    ConfigLevel.PLUGIN: ("Plugin", "Plugin Level"),
+}
+
+_LEVEL_CONFIG_PATHS = {
+    ConfigLevel.USER: "~/.claude",
+    ConfigLevel.PLUGIN: "~/.claude/plugins",
+}
+
+
 class FilterMixin:
     """Mixin providing filtering and search functionality."""
 
@@ -25,45 +39,16 @@ class FilterMixin:
     _app_footer: "AppFooter | None"
     _discovery_service: "ConfigDiscoveryService"
 
-    def action_filter_all(self) -> None:
-        """Show all customizations (clear level filter)."""
-        self._level_filter = None
-        self._last_focused_panel = None
-        if self._main_pane:
-            self._main_pane.customization = None
-        self._update_panels()  # type: ignore[attr-defined]
-        self._update_subtitle()  # type: ignore[attr-defined]
-        self._update_status_filter("All")
-
-    def action_filter_user(self) -> None:
-        """Show only user-level customizations."""
-        self._level_filter = ConfigLevel.USER
-        self._last_focused_panel = None
-        if self._main_pane:
-            self._main_pane.customization = None
-        self._update_panels()  # type: ignore[attr-defined]
-        self._update_subtitle()  # type: ignore[attr-defined]
-        self._update_status_filter("User")
-
-    def action_filter_project(self) -> None:
-        """Show only project-level customizations."""
-        self._level_filter = ConfigLevel.PROJECT
-        self._last_focused_panel = None
-        if self._main_pane:
-            self._main_pane.customization = None
-        self._update_panels()  # type: ignore[attr-defined]
-        self._update_subtitle()  # type: ignore[attr-defined]
-        self._update_status_filter("Project")
-
-    def action_filter_plugin(self) -> None:
-        """Show only plugin-level customizations."""
-        self._level_filter = ConfigLevel.PLUGIN
+    def action_filter_level(self, level_name: str) -> None:
+        """Show customizations from one level ("ALL" clears the level filter)."""
+        level = ConfigLevel.__members__.get(level_name)
+        self._level_filter = level
         self._last_focused_panel = None
         if self._main_pane:
             self._main_pane.customization = None
         self._update_panels()  # type: ignore[attr-defined]
         self._update_subtitle()  # type: ignore[attr-defined]
-        self._update_status_filter("Plugin")
+        self._update_status_filter(level)
 
     def action_toggle_plugin_enabled_filter(self) -> None:
         """Toggle between enabled-only and showing all plugins."""
@@ -88,20 +73,17 @@ class FilterMixin:
         if self._filter_input:
             self._filter_input.show()
 
-    def _update_status_filter(self, level: str) -> None:
+    def _update_status_filter(self, level: ConfigLevel | None) -> None:
         """Update status panel and footer filter level and path display."""
+        status_label, _ = LEVEL_FILTER_LABELS[level]
         if self._status_panel:
-            self._status_panel.filter_level = level
-            if level == "User":
-                self._status_panel.config_path = "~/.claude"
-            elif level == "Project":
-                self._status_panel.config_path = str(
-                    self._discovery_service.project_config_path
-                )
-            elif level == "Plugin":
-                self._status_panel.config_path = "~/.claude/plugins"
+            self._status_panel.filter_level = status_label
+            if level == ConfigLevel.PROJECT:
+                config_path = str(self._discovery_service.project_config_path)
+            elif level is None:
+                config_path = self._discovery_service.project_root.name
             else:
-                project_name = self._discovery_service.project_root.name
-                self._status_panel.config_path = project_name
+                config_path = _LEVEL_CONFIG_PATHS[level]
+            self._status_panel.config_path = config_path
         if self._app_footer:
-            self._app_footer.filter_level = level
+            self._app_footer.filter_level = status_label
@@ -4,22 +4,7 @@ from textual.widgets import Static
 
 from lazyclaude import __version__
 
-
-class HelpMixin:
-    """Mixin providing help overlay functionality."""
-
-    _help_visible: bool
-
-    def action_toggle_help(self) -> None:
-        """Toggle help overlay visibility."""
-        if self._help_visible:
-            self._hide_help()
-        else:
-            self._show_help()
-
-    def _show_help(self) -> None:
-        """Show help overlay."""
-        help_content = f"""[bold]LazyClaude v{__version__}[/]
+_HELP_TEXT = f"""[bold]LazyClaude v{__version__}[/]
 
 [bold]Navigation[/]
   j/k or Up/Down     Move up/down in list
@@ -58,16 +43,27 @@ class HelpMixin:
 
 [dim]Press ? or Esc to close[/]"""
 
-        if not self.query("#help-overlay"):  # type: ignore[attr-defined]
-            help_widget = Static(help_content, id="help-overlay")
-            self.mount(help_widget)  # type: ignore[attr-defined]
-            self._help_visible = True
+
+class HelpMixin:
+    """Mixin providing help overlay functionality."""
+
+    _help_widget: Static | None
+
+    def action_toggle_help(self) -> None:
+        """Toggle help overlay visibility."""
+        if self._help_widget is not None:
+            self._hide_help()
+        else:
+            self._show_help()
+
+    def _show_help(self) -> None:
+        """Show help overlay."""
+        if self._help_widget is None:
+            self._help_widget = Static(_HELP_TEXT, id="help-overlay")
+            self.mount(self._help_widget)  # type: ignore[attr-defined]
 
     def _hide_help(self) -> None:
         """Hide help overlay."""
-        try:
-            help_widget = self.query_one("#help-overlay")  # type: ignore[attr-defined]
-            help_widget.remove()
-            self._help_visible = False
-        except Exception:
-            pass
+        if self._help_widget is not None:
+            self._help_widget.remove()
+            self._help_widget = None
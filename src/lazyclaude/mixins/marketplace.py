@@ -1,6 +1,5 @@
 """Marketplace mixin for LazyClaude application."""
 
-import os
 import subprocess
 from typing import TYPE_CHECKING
 
@@ -241,8 +240,7 @@ class MarketplaceMixin:
             self.notify("Plugin folder not found", severity="warning")  # type: ignore[attr-defined]
             return
 
-        editor = os.environ.get("EDITOR", "vi")
-        subprocess.Popen([editor, str(plugin.install_path)], shell=True)
+        self._launch_editor([plugin.install_path])  # type: ignore[attr-defined]
 
     def on_marketplace_modal_open_plugin_source(
         self, message: MarketplaceModal.OpenPluginSource
@@ -2,6 +2,9 @@
 
 from typing import TYPE_CHECKING
 
+from textual import events
+from textual.widget import Widget
+
 from lazyclaude.models.customization import CustomizationType
 
 if TYPE_CHECKING:
@@ -9,6 +12,13 @@ if TYPE_CHECKING:
     from lazyclaude.widgets.detail_pane import MainPane
     from lazyclaude.widgets.type_panel import TypePanel
 
+COMBINED_PANEL_NUMBERS = {
+    4: CustomizationType.MEMORY_FILE,
+    5: CustomizationType.MCP,
+    6: CustomizationType.HOOK,
+    7: CustomizationType.LSP_SERVER,
+}
+
 
 class NavigationMixin:
     """Mixin providing panel navigation and focus management."""
@@ -19,6 +29,8 @@ class NavigationMixin:
     _last_focused_panel: "TypePanel | None"
     _last_focused_combined: bool
     _plugin_preview_mode: bool
+    _focused_panel_index: int | None
+    _panel_indices: dict[Widget, int]
 
     def action_focus_next_panel(self) -> None:
         """Focus the next panel (panels 1-3, then combined panel)."""
@@ -48,54 +60,45 @@ class NavigationMixin:
         elif current > 0:
             self._panels[current - 1].focus()
 
-    def _get_focused_panel_index(self) -> int | None:
-        """Get the index of the currently focused panel (combined panel = len(panels))."""
-        for i, panel in enumerate(self._panels):
-            if panel.has_focus:
-                return i
-        if self._combined_panel and self._combined_panel.has_focus:
-            return len(self._panels)
-        return None
-
-    def _focus_panel(self, index: int) -> None:
-        """Focus a specific panel by index (0-based)."""
-        if 0 <= index < len(self._panels):
-            self._panels[index].focus()
-
-    def action_focus_panel_1(self) -> None:
-        """Focus panel 1 (Slash Commands)."""
-        self._focus_panel(0)
-
-    def action_focus_panel_2(self) -> None:
-        """Focus panel 2 (Subagents)."""
-        self._focus_panel(1)
-
-    def action_focus_panel_3(self) -> None:
-        """Focus panel 3 (Skills)."""
-        self._focus_panel(2)
-
-    def action_focus_panel_4(self) -> None:
-        """Focus combined panel and switch to Memory Files."""
+    def _index_panels(self) -> None:
+        """Map each panel to its index (combined panel = len(panels))."""
+        self._panel_indices = {panel: i for i, panel in enumerate(self._panels)}
         if self._combined_panel:
-            self._combined_panel.switch_to_type(CustomizationType.MEMORY_FILE)
-            self._combined_panel.focus()
+            self._panel_indices[self._combined_panel] = len(self._panels)
 
-    def action_focus_panel_5(self) -> None:
-        """Focus combined panel and switch to MCPs."""
-        if self._combined_panel:
-            self._combined_panel.switch_to_type(CustomizationType.MCP)
-            self._combined_panel.focus()
+    def on_descendant_focus(self, event: events.DescendantFocus) -> None:
+        """Remember which panel holds focus so lookups avoid scanning."""
+        self._focused_panel_index = self._panel_indices.get(event.widget)
 
-    def action_focus_panel_6(self) -> None:
-        """Focus combined panel and switch to Hooks."""
-        if self._combined_panel:
-            self._combined_panel.switch_to_type(CustomizationType.HOOK)
-            self._combined_panel.focus()
+    def _panel_at(self, index: int) -> "TypePanel | CombinedPanel | None":
+        """Get the panel at an index (combined panel = len(panels))."""
+        if index < len(self._panels):
+            return self._panels[index]
+        return self._combined_panel
 
-    def action_focus_panel_7(self) -> None:
-        """Focus combined panel and switch to LSP Servers."""
-        if self._combined_panel:
-            self._combined_panel.switch_to_type(CustomizationType.LSP_SERVER)
+    def _get_focused_panel_index(self) -> int | None:
+        """Get the index of the currently focused panel (combined panel = len(panels))."""
+        # Messages still arriving during shutdown find no screen to ask.
+        if not self.screen_stack:  # type: ignore[attr-defined]
+            return None
+        # Focus events, and the has_focus flags they set, trail the screen's
+        # focus change, so a key press can beat them. Confirm the cached index
+        # against the focused widget before trusting it.
+        focused = self.focused  # type: ignore[attr-defined]
+        index = self._focused_panel_index
+        if index is not None and self._panel_at(index) is focused:
+            return index
+        return self._panel_indices.get(focused) if focused else None
+
+    def action_focus_panel(self, number: int) -> None:
+        """Focus panel by its 1-based number (4-7 select a combined panel tab)."""
+        if number <= len(self._panels):
+            if number >= 1:
+                self._panels[number - 1].focus()
+            return
+        ctype = COMBINED_PANEL_NUMBERS.get(number)
+        if ctype and self._combined_panel:
+            self._combined_panel.switch_to_type(ctype)
             self._combined_panel.focus()
 
     def action_focus_main_pane(self) -> None:
@@ -17,13 +17,7 @@ class ConfigLevel(Enum):
     @property
     def label(self) -> str:
         """Human-readable label for this config level."""
-        labels = {
-            ConfigLevel.USER: "User",
-            ConfigLevel.PROJECT: "Project",
-            ConfigLevel.PROJECT_LOCAL: "Project-Local",
-            ConfigLevel.PLUGIN: "Plugin",
-        }
-        return labels[self]
+        return _LEVEL_LABELS[self]
 
 
 class PluginScope(Enum):
@@ -46,7 +40,33 @@ class CustomizationType(Enum):
     LSP_SERVER = auto()
 
 
-@dataclass
+_TYPE_ORDER = {t: i for i, t in enumerate(CustomizationType)}
+
+_LEVEL_LABELS = {
+    ConfigLevel.USER: "User",
+    ConfigLevel.PROJECT: "Project",
+    ConfigLevel.PROJECT_LOCAL: "Project-Local",
+    ConfigLevel.PLUGIN: "Plugin",
+}
+
+_LEVEL_INDICATORS = {
+    ConfigLevel.USER: "[U]",
+    ConfigLevel.PROJECT: "[P]",
+    ConfigLevel.PROJECT_LOCAL: "[L]",
+}
+
+_TYPE_LABELS = {
+    CustomizationType.SLASH_COMMAND: "Slash Command",
+    CustomizationType.SUBAGENT: "Subagent",
+    CustomizationType.SKILL: "Skill",
+    CustomizationType.MEMORY_FILE: "Memory File",
+    CustomizationType.MCP: "MCP Server",
+    CustomizationType.HOOK: "Hook",
+    CustomizationType.LSP_SERVER: "LSP Server",
+}
+
+
+@dataclass(slots=True)
 class SlashCommandMetadata:
     """Metadata specific to slash commands."""
 
@@ -56,7 +76,7 @@ class SlashCommandMetadata:
     disable_model_invocation: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SubagentMetadata:
     """Metadata specific to subagents."""
 
@@ -72,10 +92,24 @@ class SkillFile:
 
     name: str
     path: Path
-    content: str | None = None
     is_directory: bool = False
     children: list["SkillFile"] = field(default_factory=list)
 
+    _content: str | None = field(default=None, init=False, repr=False, compare=False)
+    _content_loaded: bool = field(default=False, init=False, repr=False, compare=False)
+
+    @property
+    def content(self) -> str | None:
+        """File content, read from disk on first access (None if unreadable)."""
+        if not self._content_loaded:
+            self._content_loaded = True
+            if not self.is_directory:
+                try:
+                    self._content = self.path.read_text(encoding="utf-8")
+                except (OSError, UnicodeDecodeError):
+                    self._content = None
+        return self._content
+
 
 @dataclass
 class MemoryFileRef:
@@ -88,7 +122,7 @@ class MemoryFileRef:
     children: list["MemoryFileRef"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMetadata:
     """Metadata specific to skills."""
 
@@ -100,7 +134,7 @@ class SkillMetadata:
     files: list[SkillFile] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPServerMetadata:
     """Metadata specific to MCP servers."""
 
@@ -111,7 +145,7 @@ class MCPServerMetadata:
     env: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginInfo:
     """Information about the source plugin for a customization."""
 
@@ -125,7 +159,7 @@ class PluginInfo:
     project_path: Path | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Customization:
     """A Claude Code customization item."""
 
@@ -141,6 +175,34 @@ class Customization:
     error: str | None = None
     plugin_info: PluginInfo | None = None
 
+    _search_text: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _display_name: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sort_key: tuple[int, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def sort_key(self) -> tuple[int, str]:
+        """Ordering key (type order, lowercase name), built on first use."""
+        if self._sort_key is None:
+            self._sort_key = (_TYPE_ORDER[self.type], self.name.lower())
+        return self._sort_key
+
+    @property
+    def search_text(self) -> str:
+        """Lowercased text matched by search queries, built on first use."""
+        if self._search_text is None:
+            if self.plugin_info:
+                text = f"{self.plugin_info.short_name}:{self.name}"
+            else:
+                text = self.name
+            self._search_text = text.lower()
+        return self._search_text
+
     @property
     def has_error(self) -> bool:
         """Check if this customization failed to load."""
@@ -149,17 +211,15 @@ class Customization:
     @property
     def display_name(self) -> str:
         """Name for display in UI, with level indicator or plugin prefix."""
-        if self.plugin_info:
-            base = f"[dim]{self.plugin_info.short_name}:[/]{self.name}"
-            if not self.plugin_info.is_enabled:
-                return f"[dim]{base}[/]"
-            return base
-        level_indicator = {
-            ConfigLevel.USER: "[U]",
-            ConfigLevel.PROJECT: "[P]",
-            ConfigLevel.PROJECT_LOCAL: "[L]",
-        }
-        return f"{self.name} {level_indicator[self.level]}"
+        if self._display_name is None:
+            if self.plugin_info:
+                text = f"[dim]{self.plugin_info.short_name}:[/]{self.name}"
+                if not self.plugin_info.is_enabled:
+                    text = f"[dim]{text}[/]"
+            else:
+                text = f"{self.name} {_LEVEL_INDICATORS[self.level]}"
+            self._display_name = text
+        return self._display_name
 
     @property
     def level_label(self) -> str:
@@ -169,12 +229,4 @@ class Customization:
     @property
     def type_label(self) -> str:
         """Human-readable type label."""
-        return {
-            CustomizationType.SLASH_COMMAND: "Slash Command",
-            CustomizationType.SUBAGENT: "Subagent",
-            CustomizationType.SKILL: "Skill",
-            CustomizationType.MEMORY_FILE: "Memory File",
-            CustomizationType.MCP: "MCP Server",
-            CustomizationType.HOOK: "Hook",
-            CustomizationType.LSP_SERVER: "LSP Server",
-        }[self.type]
+        return _TYPE_LABELS[self.type]
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+_CORE_PLUGIN_FIELDS = frozenset({"name", "description", "source"})
+
 
 @dataclass
 class MarketplaceSource:
@@ -37,7 +39,20 @@ class MarketplacePlugin:
     is_enabled: bool = True
     install_path: Path | None = None
     installed_version: str | None = None
-    extra_metadata: dict[str, Any] = field(default_factory=dict)
+    raw_data: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    _extra_metadata: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def extra_metadata(self) -> dict[str, Any]:
+        """marketplace.json fields beyond name/description/source, built on first use."""
+        if self._extra_metadata is None:
+            self._extra_metadata = {
+                k: v for k, v in self.raw_data.items() if k not in _CORE_PLUGIN_FIELDS
+            }
+        return self._extra_metadata
 
 
 @dataclass
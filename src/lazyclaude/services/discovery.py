@@ -1,7 +1,12 @@
 """Service for discovering Claude Code customizations."""
 
-import json
+import os
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 
 from lazyclaude.models.customization import (
@@ -15,8 +20,10 @@ from lazyclaude.services.filesystem_scanner import (
     FilesystemScanner,
     GlobStrategy,
     ScanConfig,
+    scandir_files,
 )
 from lazyclaude.services.gitignore_filter import GitignoreFilter
+from lazyclaude.services.json_cache import JsonFileCache
 from lazyclaude.services.parsers.hook import HookParser
 from lazyclaude.services.parsers.lsp_server import LSPServerParser
 from lazyclaude.services.parsers.mcp import MCPParser
@@ -26,6 +33,21 @@ from lazyclaude.services.parsers.slash_command import SlashCommandParser
 from lazyclaude.services.parsers.subagent import SubagentParser
 from lazyclaude.services.plugin_loader import PluginLoader
 
+MAX_DISCOVERY_WORKERS = 8
+
+# Build output and tool caches pruned from the project-wide CLAUDE.md walk.
+# Kept out of the shared skip list so a skill or command directory that
+# happens to share one of these names is still discovered.
+MEMORY_WALK_SKIP_DIRS = frozenset(
+    {".ruff_cache", "site-packages", "target", ".next", ".gradle", ".terraform"}
+)
+
+# These parsers keep no per-file state, so one instance is shared by all scans.
+_MCP_PARSER = MCPParser()
+_HOOK_PARSER = HookParser()
+_MEMORY_PARSER = MemoryFileParser()
+_LSP_PARSER = LSPServerParser()
+
 SCAN_CONFIGS = {
     "slash_commands": ScanConfig(
         subdir="commands",
@@ -44,6 +66,7 @@ SCAN_CONFIGS = {
         pattern="SKILL.md",
         strategy=GlobStrategy.SUBDIR,
         parser_factory=SkillParser,
+        cache_parses=False,
     ),
 }
 
@@ -126,6 +149,7 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         self,
         user_config_path: Path | None = None,
         project_config_path: Path | None = None,
+        plugin_loader: PluginLoader | None = None,
     ) -> None:
         """
         Initialize the discovery service.
@@ -133,6 +157,8 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         Args:
             user_config_path: Override for ~/.claude (testing)
             project_config_path: Override for ./.claude (testing)
+            plugin_loader: Shared loader whose cached registry other services
+                also read (default: one built for these paths)
         """
         self.user_config_path = user_config_path or Path.home() / ".claude"
         self.project_config_path = (
@@ -142,63 +168,127 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         )
         self.project_root = self.project_config_path.parent
 
+        # Fixed config file locations, joined once rather than on every scan.
+        self._claude_json = Path.home() / ".claude.json"
+        self._project_mcp_file = self.project_root / ".mcp.json"
+        self._rules_dirs = (
+            (self.user_config_path / "rules", ConfigLevel.USER),
+            (self.project_config_path / "rules", ConfigLevel.PROJECT),
+        )
+        self._settings_files = (
+            (self.user_config_path / "settings.json", ConfigLevel.USER),
+            (self.project_config_path / "settings.json", ConfigLevel.PROJECT),
+            (
+                self.project_config_path / "settings.local.json",
+                ConfigLevel.PROJECT_LOCAL,
+            ),
+        )
+        project_path = str(self.project_root).replace("\\", "/")
+        self._project_keys = (project_path, project_path.replace("/", "\\"))
+
         self._gitignore_filter = GitignoreFilter(project_root=self.project_root)
-        self._scanner = FilesystemScanner(gitignore_filter=self._gitignore_filter)
-        self._plugin_loader = PluginLoader(
+        # Scans already run as tasks in discover_all's pool; parsing them in
+        # a pool of their own would multiply the thread count.
+        self._scanner = FilesystemScanner(
+            gitignore_filter=self._gitignore_filter, parse_workers=1
+        )
+        self._json_cache = JsonFileCache()
+        self.plugin_loader = plugin_loader or PluginLoader(
             self.user_config_path,
             project_config_path=self.project_config_path,
             project_root=self.project_root,
+            json_cache=self._json_cache,
         )
         self._cache: list[Customization] | None = None
+        self._active_config_path: Path | None = None
+        self._by_type: dict[CustomizationType, list[Customization]] = {}
+        self._by_level: dict[ConfigLevel, list[Customization]] = {}
+        self._resolved_dirs: dict[Path, str] = {}
+        self._discovery_sources = self._build_discovery_sources()
 
     def discover_all(self) -> list[Customization]:
         """Discover all customizations from all configuration levels."""
         if self._cache is not None:
             return self._cache
 
-        customizations: list[Customization] = []
-
-        for config in SCAN_CONFIGS.values():
-            customizations.extend(
-                self._scanner.scan_directory(
-                    self.user_config_path, config, ConfigLevel.USER
-                )
-            )
-            customizations.extend(
-                self._scanner.scan_directory(
-                    self.project_config_path, config, ConfigLevel.PROJECT
-                )
-            )
-
-        customizations.extend(self._discover_memory_files())
-        customizations.extend(self._discover_rules())
-        customizations.extend(self._discover_mcps())
-        customizations.extend(self._discover_hooks())
-        customizations.extend(self._discover_plugins())
+        # Sources touch disjoint paths and are I/O bound, so scan them together.
+        # Plugin scans share the same pool rather than nesting one of their own.
+        sources = [*self._discovery_sources, *self._plugin_sources()]
+        workers = min(MAX_DISCOVERY_WORKERS, len(sources))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(source) for source in sources]
+            customizations = [c for future in futures for c in future.result()]
 
         customizations = self._sort_customizations(customizations)
+        self._index(customizations)
         self._cache = customizations
         return customizations
 
+    def _index(self, customizations: list[Customization]) -> None:
+        """Bucket discovered customizations by type and level in one pass."""
+        by_type: dict[CustomizationType, list[Customization]] = defaultdict(list)
+        by_level: dict[ConfigLevel, list[Customization]] = defaultdict(list)
+        for customization in customizations:
+            by_type[customization.type].append(customization)
+            by_level[customization.level].append(customization)
+        self._by_type = by_type
+        self._by_level = by_level
+
+    def _build_discovery_sources(self) -> list[Callable[[], list[Customization]]]:
+        """Flatten every independent discovery step into a list of callables."""
+        sources = self._scan_sources(
+            [
+                (self.user_config_path, ConfigLevel.USER, None),
+                (self.project_config_path, ConfigLevel.PROJECT, None),
+            ]
+        )
+        sources.extend(
+            [
+                self._discover_memory_files,
+                self._discover_rules,
+                self._discover_mcps,
+                self._discover_hooks,
+            ]
+        )
+        return sources
+
+    def _scan_sources(
+        self, targets: list[tuple[Path, ConfigLevel, PluginInfo | None]]
+    ) -> list[Callable[[], list[Customization]]]:
+        """Build one scan callable per (root, level, plugin) target and config."""
+        return [
+            partial(self._scanner.scan_directory, root, config, level, plugin_info)
+            for root, level, plugin_info in targets
+            for config in SCAN_CONFIGS.values()
+        ]
+
     def discover_by_level(self, level: ConfigLevel) -> list[Customization]:
         """Discover customizations from a specific configuration level."""
-        return [c for c in self.discover_all() if c.level == level]
+        self.discover_all()
+        return list(self._by_level.get(level, []))
 
     def discover_by_type(self, ctype: CustomizationType) -> list[Customization]:
         """Discover customizations of a specific type from all levels."""
-        return [c for c in self.discover_all() if c.type == ctype]
+        self.discover_all()
+        return list(self._by_type.get(ctype, []))
 
     def refresh(self) -> list[Customization]:
         """Re-scan all configuration directories and return fresh results."""
         self._cache = None
-        self._plugin_loader.refresh()
+        self._active_config_path = None
+        self._resolved_dirs.clear()
+        self.plugin_loader.refresh()
         return self.discover_all()
 
     def get_active_config_path(self) -> Path:
         """Get the active configuration path (project if exists, else user)."""
-        if self.project_config_path.is_dir():
-            return self.project_config_path
-        return self.user_config_path
+        if self._active_config_path is None:
+            self._active_config_path = (
+                self.project_config_path
+                if os.path.isdir(self.project_config_path)
+                else self.user_config_path
+            )
+        return self._active_config_path
 
     def discover_from_directory(
         self,
@@ -219,7 +309,7 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
             )
 
         if marketplace_plugin:
-            seen_paths = {c.path.resolve() for c in customizations if c.path}
+            seen_paths = {os.path.realpath(c.path) for c in customizations if c.path}
             customizations.extend(
                 self._discover_marketplace_components(
                     plugin_dir, marketplace_plugin, plugin_info, seen_paths
@@ -239,18 +329,14 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         self, customizations: list[Customization]
     ) -> list[Customization]:
         """Sort customizations by type order then name."""
-        type_order = {t: i for i, t in enumerate(CustomizationType)}
-        return sorted(
-            customizations,
-            key=lambda c: (type_order[c.type], c.name.lower()),
-        )
+        return sorted(customizations, key=attrgetter("sort_key"))
 
     def _discover_marketplace_components(
         self,
         plugin_dir: Path,
         marketplace_plugin: MarketplacePlugin,
         plugin_info: PluginInfo | None,
-        seen_paths: set[Path],
+        seen_paths: set[str],
     ) -> list[Customization]:
         """Discover components using custom paths from marketplace.json."""
         customizations: list[Customization] = []
@@ -311,7 +397,7 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         plugin_dir: Path,
         paths: list[str],
         plugin_info: PluginInfo | None,
-        seen_paths: set[Path],
+        seen_paths: set[str],
     ) -> list[Customization]:
         """Discover markdown-based customizations from custom paths."""
         customizations: list[Customization] = []
@@ -319,16 +405,17 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         for path_str in paths:
             target = (plugin_dir / path_str).resolve()
 
-            if target.is_file() and target.suffix == ".md":
-                if target not in seen_paths:
+            if os.path.isfile(target) and target.suffix == ".md":
+                key = str(target)
+                if key not in seen_paths:
                     c = parser.parse(target, ConfigLevel.PLUGIN)
                     if plugin_info:
                         c.plugin_info = plugin_info
                     customizations.append(c)
-                    seen_paths.add(target)
-            elif target.is_dir():
-                for md_file in target.rglob("*.md"):
-                    resolved = md_file.resolve()
+                    seen_paths.add(key)
+            elif os.path.isdir(target):
+                for md_file in scandir_files(target, "*.md", recursive=True):
+                    resolved = os.path.realpath(md_file)
                     if resolved not in seen_paths:
                         c = parser.parse(md_file, ConfigLevel.PLUGIN)
                         if plugin_info:
@@ -343,7 +430,7 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         plugin_dir: Path,
         paths: list[str],
         plugin_info: PluginInfo | None,
-        seen_paths: set[Path],
+        seen_paths: set[str],
     ) -> list[Customization]:
         """Discover skills from custom paths."""
         customizations: list[Customization] = []
@@ -352,10 +439,10 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         for path_str in paths:
             target = (plugin_dir / path_str).resolve()
 
-            if target.is_dir():
+            if os.path.isdir(target):
                 skill_file = target / "SKILL.md"
-                if skill_file.is_file():
-                    resolved = skill_file.resolve()
+                if os.path.isfile(skill_file):
+                    resolved = os.path.realpath(skill_file)
                     if resolved not in seen_paths:
                         c = parser.parse(skill_file, ConfigLevel.PLUGIN)
                         if plugin_info:
@@ -375,10 +462,10 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         customizations: list[Customization] = []
         mcp_file = (plugin_dir / mcp_path).resolve()
 
-        if not mcp_file.is_file():
+        if not os.path.isfile(mcp_file):
             return customizations
 
-        parser = MCPParser()
+        parser = _MCP_PARSER
         for customization in parser.parse(mcp_file, ConfigLevel.PLUGIN):
             if plugin_info:
                 customization.plugin_info = plugin_info
@@ -396,10 +483,10 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         customizations: list[Customization] = []
         hooks_file = (plugin_dir / hooks_path).resolve()
 
-        if not hooks_file.is_file():
+        if not os.path.isfile(hooks_file):
             return customizations
 
-        parser = HookParser()
+        parser = _HOOK_PARSER
         for customization in parser.parse(hooks_file, ConfigLevel.PLUGIN):
             if plugin_info:
                 customization.plugin_info = plugin_info
@@ -407,28 +494,42 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
 
         return customizations
 
+    def _file_identity(self, path: Path) -> tuple[int, int] | str:
+        """Identity used to dedupe files: (st_dev, st_ino), or canonical path."""
+        # Windows does not report reliable inode numbers through os.stat.
+        if os.name != "nt":
+            try:
+                stat = os.stat(path)
+                return (stat.st_dev, stat.st_ino)
+            except OSError:
+                pass
+        return self._canonical_key(path)
+
+    def _canonical_key(self, path: Path) -> str:
+        """Canonical path string for dedup, resolving each parent directory once."""
+        if path.is_symlink():
+            return str(path.resolve())
+        parent = path.parent
+        resolved_parent = self._resolved_dirs.get(parent)
+        if resolved_parent is None:
+            resolved_parent = str(parent.resolve())
+            self._resolved_dirs[parent] = resolved_parent
+        return os.path.join(resolved_parent, path.name)
+
     def _discover_memory_files(self) -> list[Customization]:
         """Discover memory files from user and project levels."""
         customizations: list[Customization] = []
-        parser = MemoryFileParser()
-        seen_paths: set[Path] = set()
+        parser = _MEMORY_PARSER
+        seen_files: set[tuple[int, int] | str] = set()
 
-        user_memory_files = [
-            self.user_config_path / "CLAUDE.md",
-            self.user_config_path / "AGENTS.md",
-        ]
-        for memory_file in user_memory_files:
+        # Stat each fixed name rather than matching a directory listing, so
+        # case-insensitive filesystems still find e.g. claude.md.
+        for name in ("CLAUDE.md", "AGENTS.md", "CLAUDE.local.md"):
+            memory_file = self.user_config_path / name
             if memory_file.is_file():
-                resolved = memory_file.resolve()
-                seen_paths.add(resolved)
+                seen_files.add(self._file_identity(memory_file))
                 customizations.append(parser.parse(memory_file, ConfigLevel.USER))
 
-        user_local_file = self.user_config_path / "CLAUDE.local.md"
-        if user_local_file.is_file():
-            resolved = user_local_file.resolve()
-            seen_paths.add(resolved)
-            customizations.append(parser.parse(user_local_file, ConfigLevel.USER))
-
         project_memory_files = [
             self.project_config_path / "CLAUDE.md",
             self.project_config_path / "AGENTS.md",
@@ -437,17 +538,19 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         ]
 
         for memory_file in project_memory_files:
-            resolved = memory_file.resolve()
-            if memory_file.is_file() and resolved not in seen_paths:
-                seen_paths.add(resolved)
+            if not memory_file.is_file():
+                continue
+            key = self._file_identity(memory_file)
+            if key not in seen_files:
+                seen_files.add(key)
                 customizations.append(parser.parse(memory_file, ConfigLevel.PROJECT))
 
         for claude_md in self._gitignore_filter.walk_filtered(
-            self.project_root, "CLAUDE.md"
+            self.project_root, "CLAUDE.md", extra_skip_dirs=MEMORY_WALK_SKIP_DIRS
         ):
-            resolved = claude_md.resolve()
-            if resolved not in seen_paths:
-                seen_paths.add(resolved)
+            key = self._file_identity(claude_md)
+            if key not in seen_files:
+                seen_files.add(key)
                 customization = parser.parse(claude_md, ConfigLevel.PROJECT)
                 try:
                     rel_path = claude_md.relative_to(self.project_root)
@@ -456,14 +559,13 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
                     pass
                 customizations.append(customization)
 
-        project_local_files = [
-            self.project_root / "CLAUDE.local.md",
-            self.project_config_path / "CLAUDE.local.md",
-        ]
-        for local_file in project_local_files:
-            resolved = local_file.resolve()
-            if local_file.is_file() and resolved not in seen_paths:
-                seen_paths.add(resolved)
+        for directory in (self.project_root, self.project_config_path):
+            local_file = directory / "CLAUDE.local.md"
+            if not local_file.is_file():
+                continue
+            key = self._file_identity(local_file)
+            if key not in seen_files:
+                seen_files.add(key)
                 customizations.append(
                     parser.parse(local_file, ConfigLevel.PROJECT_LOCAL)
                 )
@@ -473,39 +575,24 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
     def _discover_rules(self) -> list[Customization]:
         """Discover rules from user and project levels."""
         customizations: list[Customization] = []
-        parser = MemoryFileParser()
-        seen_paths: set[Path] = set()
-
-        user_rules_dir = self.user_config_path / "rules"
-        if user_rules_dir.is_dir():
-            for rule_file in self._gitignore_filter.walk_filtered(
-                user_rules_dir, "*.md"
-            ):
-                if not rule_file.is_file():
+        parser = _MEMORY_PARSER
+        seen_files: set[tuple[int, int] | str] = set()
+
+        for rules_dir, level in self._rules_dirs:
+            if not os.path.isdir(rules_dir):
+                continue
+            # walk_filtered already yields only names os.walk listed as
+            # non-directories; is_file() just drops broken symlinks.
+            for rule_file in self._gitignore_filter.walk_filtered(rules_dir, "*.md"):
+                if not os.path.isfile(rule_file):
                     continue
-                resolved = rule_file.resolve()
-                if resolved in seen_paths:
+                key = self._file_identity(rule_file)
+                if key in seen_files:
                     continue
-                seen_paths.add(resolved)
+                seen_files.add(key)
 
-                customization = parser.parse(rule_file, ConfigLevel.USER)
-                customization.name = str(rule_file.relative_to(user_rules_dir))
-                customizations.append(customization)
-
-        project_rules_dir = self.project_config_path / "rules"
-        if project_rules_dir.is_dir():
-            for rule_file in self._gitignore_filter.walk_filtered(
-                project_rules_dir, "*.md"
-            ):
-                if not rule_file.is_file():
-                    continue
-                resolved = rule_file.resolve()
-                if resolved in seen_paths:
-                    continue
-                seen_paths.add(resolved)
-
-                customization = parser.parse(rule_file, ConfigLevel.PROJECT)
-                customization.name = str(rule_file.relative_to(project_rules_dir))
+                customization = parser.parse(rule_file, level)
+                customization.name = os.path.relpath(rule_file, rules_dir)
                 customizations.append(customization)
 
         return customizations
@@ -513,16 +600,22 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
     def _discover_mcps(self) -> list[Customization]:
         """Discover MCP configurations from user, local, and project levels."""
         customizations: list[Customization] = []
-        parser = MCPParser()
+        parser = _MCP_PARSER
 
-        user_mcp_file = Path.home() / ".claude.json"
-        if user_mcp_file.is_file():
-            customizations.extend(parser.parse(user_mcp_file, ConfigLevel.USER))
+        user_mcp_file = self._claude_json
+        if os.path.isfile(user_mcp_file):
+            customizations.extend(
+                parser.parse(
+                    user_mcp_file,
+                    ConfigLevel.USER,
+                    data=self._json_cache.load(user_mcp_file),
+                )
+            )
 
         customizations.extend(self._discover_local_mcps())
 
-        project_mcp_file = self.project_root / ".mcp.json"
-        if project_mcp_file.is_file():
+        project_mcp_file = self._project_mcp_file
+        if os.path.isfile(project_mcp_file):
             customizations.extend(parser.parse(project_mcp_file, ConfigLevel.PROJECT))
 
         return customizations
@@ -530,82 +623,73 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
     def _discover_local_mcps(self) -> list[Customization]:
         """Discover local-scoped MCPs from ~/.claude.json projects."""
         customizations: list[Customization] = []
-        claude_json = Path.home() / ".claude.json"
+        claude_json = self._claude_json
 
-        if not claude_json.is_file():
+        if not os.path.isfile(claude_json):
             return customizations
 
-        try:
-            data = json.loads(claude_json.read_text(encoding="utf-8"))
-            projects = data.get("projects", {})
+        data = self._json_cache.load(claude_json)
+        if data is None:
+            return customizations
 
-            project_path = str(self.project_root).replace("\\", "/")
+        projects = data.get("projects", {})
 
-            mcp_servers = None
-            for key in [project_path, project_path.replace("/", "\\")]:
-                if key in projects:
-                    mcp_servers = projects[key].get("mcpServers", {})
-                    break
+        mcp_servers = None
+        for key in self._project_keys:
+            if key in projects:
+                mcp_servers = projects[key].get("mcpServers", {})
+                break
 
-            if not mcp_servers:
-                return customizations
+        if not mcp_servers:
+            return customizations
 
-            parser = MCPParser()
-            for server_name, server_config in mcp_servers.items():
-                customization = parser.parse_server_config(
-                    server_name, server_config, claude_json, ConfigLevel.PROJECT_LOCAL
-                )
-                customizations.append(customization)
-        except (OSError, json.JSONDecodeError):
-            pass
+        parser = _MCP_PARSER
+        for server_name, server_config in mcp_servers.items():
+            customization = parser.parse_server_config(
+                server_name, server_config, claude_json, ConfigLevel.PROJECT_LOCAL
+            )
+            customizations.append(customization)
 
         return customizations
 
     def _discover_hooks(self) -> list[Customization]:
         """Discover hooks from settings files at user and project levels."""
         customizations: list[Customization] = []
-        parser = HookParser()
-
-        user_settings = self.user_config_path / "settings.json"
-        if user_settings.is_file():
-            customizations.extend(parser.parse(user_settings, ConfigLevel.USER))
-
-        project_settings = self.project_config_path / "settings.json"
-        if project_settings.is_file():
-            customizations.extend(parser.parse(project_settings, ConfigLevel.PROJECT))
-
-        project_local_settings = self.project_config_path / "settings.local.json"
-        if project_local_settings.is_file():
-            customizations.extend(
-                parser.parse(project_local_settings, ConfigLevel.PROJECT_LOCAL)
-            )
-
-        return customizations
-
-    def _discover_plugins(self) -> list[Customization]:
-        """Discover customizations from ALL installed plugins (enabled and disabled)."""
-        customizations: list[Customization] = []
-
-        for plugin_info in self._plugin_loader.get_all_plugins():
-            install_path = plugin_info.install_path
+        parser = _HOOK_PARSER
 
-            for config in SCAN_CONFIGS.values():
+        for settings_file, level in self._settings_files:
+            if os.path.isfile(settings_file):
                 customizations.extend(
-                    self._scanner.scan_directory(
-                        install_path, config, ConfigLevel.PLUGIN, plugin_info
+                    parser.parse(
+                        settings_file, level, data=self._json_cache.load(settings_file)
                     )
                 )
 
-            customizations.extend(self._discover_plugin_mcps(install_path, plugin_info))
-            customizations.extend(
-                self._discover_plugin_hooks(install_path, plugin_info)
-            )
-            customizations.extend(
-                self._discover_plugin_lsp_servers(install_path, plugin_info)
-            )
-
         return customizations
 
+    def _plugin_sources(self) -> list[Callable[[], list[Customization]]]:
+        """Build discovery callables for ALL installed plugins (enabled and disabled)."""
+        plugin_infos = self.plugin_loader.get_all_plugins()
+
+        # One task per plugin x scan config keeps large plugins from
+        # serializing behind a single worker.
+        sources = self._scan_sources(
+            [(info.install_path, ConfigLevel.PLUGIN, info) for info in plugin_infos]
+        )
+        sources.extend(
+            partial(self._discover_plugin_configs, info) for info in plugin_infos
+        )
+        return sources
+
+    def _discover_plugin_configs(self, plugin_info: PluginInfo) -> list[Customization]:
+        """Discover the MCP, hook and LSP configs shipped with one plugin."""
+        install_path = plugin_info.install_path
+        return [
+            *self._discover_plugin_mcps(install_path, plugin_info),
+            *self._discover_plugin_hooks(install_path, plugin_info),
+            *self._discover_plugin_lsp_servers(install_path, plugin_info),
+        ]
+
     def _discover_plugin_mcps(
         self, install_path: Path, plugin_info: PluginInfo
     ) -> list[Customization]:
@@ -613,10 +697,10 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         customizations: list[Customization] = []
         mcp_file = install_path / ".mcp.json"
 
-        if not mcp_file.is_file():
+        if not os.path.isfile(mcp_file):
             return customizations
 
-        parser = MCPParser()
+        parser = _MCP_PARSER
         for customization in parser.parse(mcp_file, ConfigLevel.PLUGIN):
             customization.plugin_info = plugin_info
             customizations.append(customization)
@@ -630,10 +714,10 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
         customizations: list[Customization] = []
         hooks_file = install_path / "hooks" / "hooks.json"
 
-        if not hooks_file.is_file():
+        if not os.path.isfile(hooks_file):
             return customizations
 
-        parser = HookParser()
+        parser = _HOOK_PARSER
         for customization in parser.parse(hooks_file, ConfigLevel.PLUGIN):
             customization.plugin_info = plugin_info
             customizations.append(customization)
@@ -645,16 +729,16 @@ class ConfigDiscoveryService(IConfigDiscoveryService):
     ) -> list[Customization]:
         """Discover LSP server configurations from a plugin."""
         customizations: list[Customization] = []
-        parser = LSPServerParser()
+        parser = _LSP_PARSER
 
         lsp_file = install_path / ".lsp.json"
-        if lsp_file.is_file():
+        if os.path.isfile(lsp_file):
             for customization in parser.parse(lsp_file, ConfigLevel.PLUGIN):
                 customization.plugin_info = plugin_info
                 customizations.append(customization)
 
         plugin_json = install_path / ".claude-plugin" / "plugin.json"
-        if plugin_json.is_file():
+        if os.path.isfile(plugin_json):
             for customization in parser.parse_plugin_json(
                 plugin_json, ConfigLevel.PLUGIN
             ):
@@ -1,7 +1,10 @@
 """Generic filesystem scanner for discovering customization files."""
 
-from collections.abc import Callable
-from dataclasses import dataclass
+import fnmatch
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from enum import Enum, auto
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -11,6 +14,63 @@ from lazyclaude.models.customization import ConfigLevel, Customization, PluginIn
 if TYPE_CHECKING:
     from lazyclaude.services.gitignore_filter import GitignoreFilter
 
+MAX_PARSE_WORKERS = 8
+
+
+def has_glob_meta(pattern: str) -> bool:
+    """Check whether a pattern contains fnmatch wildcards."""
+    return any(c in pattern for c in "*?[")
+
+
+def scandir_files(root: Path, pattern: str, recursive: bool = False) -> Iterator[Path]:
+    """
+    Yield files under root whose names match a glob pattern.
+
+    Uses os.scandir so directory entries answer is_dir/is_file from the
+    cached d_type instead of a stat per entry. Like Path.rglob, symlinked
+    files are matched but symlinked directories are not descended into.
+
+    Args:
+        root: Directory to scan.
+        pattern: fnmatch-style pattern matched against file names.
+        recursive: Whether to descend into subdirectories.
+
+    Yields:
+        Paths of matching files.
+    """
+    if not recursive and not has_glob_meta(pattern):
+        # A literal name needs one stat, not a directory listing.
+        candidate = os.path.join(root, pattern)
+        if os.path.isfile(candidate):
+            yield Path(candidate)
+        return
+
+    pending = [os.fspath(root)]
+    while pending:
+        directory = pending.pop()
+        matches: list[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                        matches.append(entry.path)
+        except OSError:
+            continue
+        for match in matches:
+            yield Path(match)
+
+
+def scandir_subdirs(root: Path) -> list[os.DirEntry[str]]:
+    """List directory entries (including symlinked ones) directly under root."""
+    try:
+        with os.scandir(root) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
+
 
 class GlobStrategy(Enum):
     """How to scan for files in a directory."""
@@ -28,13 +88,24 @@ class ScanConfig:
     pattern: str
     strategy: GlobStrategy
     parser_factory: Callable[[Path], Any]
+    # Parsers that read beyond the matched file (e.g. a skill's whole tree)
+    # can't be keyed on that file's stat, so they are re-parsed every scan.
+    cache_parses: bool = True
 
 
 class FilesystemScanner:
     """Scans directories for customization files using configurable patterns."""
 
-    def __init__(self, gitignore_filter: "GitignoreFilter | None" = None) -> None:
+    def __init__(
+        self,
+        gitignore_filter: "GitignoreFilter | None" = None,
+        parse_workers: int = MAX_PARSE_WORKERS,
+    ) -> None:
         self._filter = gitignore_filter
+        self._parse_workers = parse_workers
+        self._parse_cache: dict[
+            tuple[Path, ConfigLevel], tuple[tuple[int, int], Customization]
+        ] = {}
 
     def scan_directory(
         self,
@@ -58,7 +129,7 @@ class FilesystemScanner:
         customizations: list[Customization] = []
         target_dir = base_path / config.subdir
 
-        if not target_dir.is_dir():
+        if not os.path.isdir(target_dir):
             return customizations
 
         try:
@@ -68,44 +139,78 @@ class FilesystemScanner:
 
         files = self._get_files(target_dir, config)
 
-        for file_path in files:
-            customization: Customization = parser.parse(file_path, level)
+        parse_results = self._parse_files(parser, files, level, config.cache_parses)
+        for customization in parse_results:
             if plugin_info:
                 customization.plugin_info = plugin_info
             customizations.append(customization)
 
         return customizations
 
+    def _parse_files(
+        self, parser: Any, files: list[Path], level: ConfigLevel, cache: bool
+    ) -> list[Customization]:
+        """Parse files, concurrently if allowed, preserving input order."""
+
+        def parse(file_path: Path) -> Customization:
+            if not cache:
+                uncached: Customization = parser.parse(file_path, level)
+                return uncached
+            return self._parse_cached(parser, file_path, level)
+
+        workers = min(self._parse_workers, len(files))
+        if workers < 2:
+            return [parse(file_path) for file_path in files]
+
+        # File reads release the GIL, so overlapping them shortens large scans.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(parse, files))
+
+    def _parse_cached(
+        self, parser: Any, file_path: Path, level: ConfigLevel
+    ) -> Customization:
+        """Parse a file, reusing the previous result if it has not changed."""
+        try:
+            file_stat = file_path.stat()
+        except OSError:
+            uncached: Customization = parser.parse(file_path, level)
+            return uncached
+
+        signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        key = (file_path, level)
+        cached = self._parse_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            # Callers attach plugin info, so hand out a copy rather than sharing.
+            return replace(cached[1])
+
+        customization: Customization = parser.parse(file_path, level)
+        self._parse_cache[key] = (signature, customization)
+        return replace(customization)
+
     def _get_files(self, target_dir: Path, config: ScanConfig) -> list[Path]:
         """Get files based on scan strategy."""
         if config.strategy == GlobStrategy.RGLOB:
             if self._filter:
                 return list(self._filter.walk_filtered(target_dir, config.pattern))
-            return list(target_dir.rglob(config.pattern))
+            return list(scandir_files(target_dir, config.pattern, recursive=True))
         elif config.strategy == GlobStrategy.GLOB:
-            files = list(target_dir.glob(config.pattern))
+            files = list(scandir_files(target_dir, config.pattern))
             if self._filter:
                 return [f for f in files if not self._filter.is_ignored(f)]
             return files
         elif config.strategy == GlobStrategy.SUBDIR:
-            subdirs = [
-                subdir
-                for subdir in target_dir.iterdir()
-                if subdir.is_dir()
-                and (
-                    not self._filter
-                    or (
-                        not self._filter.should_skip_dir(subdir.name)
-                        and not self._filter.is_dir_ignored(subdir)
-                    )
-                )
-            ]
             files = [
-                subdir / config.pattern
-                for subdir in subdirs
-                if (subdir / config.pattern).is_file()
+                Path(entry.path, config.pattern)
+                for entry in scandir_subdirs(target_dir)
+                if (not self._filter or not self._filter.should_skip_dir(entry.name))
+                and os.path.isfile(os.path.join(entry.path, config.pattern))
             ]
             if self._filter:
-                return [f for f in files if not self._filter.is_ignored(f)]
+                return [
+                    f
+                    for f in files
+                    if not self._filter.is_dir_ignored(f.parent)
+                    and not self._filter.is_ignored(f)
+                ]
             return files
         return []
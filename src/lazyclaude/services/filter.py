@@ -26,7 +26,8 @@ class IFilterService(ABC):
 
         Args:
             customizations: Source list to filter.
-            query: Search string (matches name only).
+            query: Search string (matches name only). Whitespace-separated
+                terms must all match.
             level: Optional level filter (None = all levels).
             plugin_enabled: Optional plugin enabled filter (None = both, True = enabled only, False = disabled only).
 
@@ -35,6 +36,21 @@ class IFilterService(ABC):
         """
         ...
 
+    @abstractmethod
+    def group_by_level(
+        self, customizations: list[Customization]
+    ) -> dict[ConfigLevel, list[Customization]]:
+        """
+        Bucket customizations by every level filter they match.
+
+        Args:
+            customizations: Source list.
+
+        Returns:
+            Mapping of level to matching customizations, in original order.
+        """
+        ...
+
     @abstractmethod
     def by_type(
         self,
@@ -65,23 +81,34 @@ class FilterService(IFilterService):
         plugin_enabled: bool | None = None,
     ) -> list[Customization]:
         """Filter customizations by search query and/or level."""
-        result = customizations
-
-        if level is not None:
-            result = [c for c in result if self._matches_level(c, level)]
-
-        if plugin_enabled is not None:
-            result = [
-                c
-                for c in result
-                if c.plugin_info is None or c.plugin_info.is_enabled == plugin_enabled
-            ]
-
-        if query:
-            query_lower = query.lower()
-            result = [c for c in result if self._matches_query(c, query_lower)]
-
-        return result
+        terms = query.lower().split()
+        if level is None and plugin_enabled is None and not terms:
+            return customizations
+
+        return [
+            c
+            for c in customizations
+            if (level is None or self._matches_level(c, level))
+            and (
+                plugin_enabled is None
+                or c.plugin_info is None
+                or c.plugin_info.is_enabled == plugin_enabled
+            )
+            and (not terms or self._matches_query(c, terms))
+        ]
+
+    def group_by_level(
+        self, customizations: list[Customization]
+    ) -> dict[ConfigLevel, list[Customization]]:
+        """Bucket customizations by every level filter they match."""
+        buckets: dict[ConfigLevel, list[Customization]] = {
+            level: [] for level in ConfigLevel
+        }
+        for c in customizations:
+            for level in ConfigLevel:
+                if self._matches_level(c, level):
+                    buckets[level].append(c)
+        return buckets
 
     def _matches_level(self, customization: Customization, level: ConfigLevel) -> bool:
         """Check if customization matches the level filter.
@@ -106,16 +133,10 @@ class FilterService(IFilterService):
 
         return False
 
-    def _matches_query(self, customization: Customization, query: str) -> bool:
-        """Check if customization matches the search query."""
-        if query in customization.name.lower():
-            return True
-        if customization.plugin_info:
-            prefix = f"{customization.plugin_info.short_name}:".lower()
-            full_name = f"{prefix}{customization.name.lower()}"
-            if query in prefix or query in full_name:
-                return True
-        return False
+    def _matches_query(self, customization: Customization, terms: list[str]) -> bool:
+        """Check if customization matches every search term."""
+        text = customization.search_text
+        return all(term in text for term in terms)
 
     def by_type(
         self,
@@ -2,11 +2,13 @@
 
 import fnmatch
 import os
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator
 from pathlib import Path
 
 import pathspec
 
+from lazyclaude.services.filesystem_scanner import has_glob_meta
+
 DEFAULT_SKIP_DIRS = {
     ".git",
     "node_modules",
@@ -124,18 +126,30 @@ class GitignoreFilter:
         dir_str = str(rel_path) + "/"
         return self._spec.match_file(dir_str)
 
-    def walk_filtered(self, root: Path, pattern: str) -> Iterator[Path]:
-        """Walk directory tree with pruning, yielding paths matching pattern."""
+    def walk_filtered(
+        self, root: Path, pattern: str, extra_skip_dirs: Collection[str] = ()
+    ) -> Iterator[Path]:
+        """Walk directory tree with pruning, yielding paths matching pattern.
+
+        extra_skip_dirs prunes further directory names for this walk only.
+        """
+        # Exact names (e.g. CLAUDE.md) skip the per-file fnmatch call.
+        exact_name = None if has_glob_meta(pattern) else os.path.normcase(pattern)
         for dirpath, dirnames, filenames in os.walk(root):
             dirnames[:] = [
                 d
                 for d in dirnames
                 if not self.should_skip_dir(d)
+                and d not in extra_skip_dirs
                 and not self.is_dir_ignored(Path(dirpath) / d)
             ]
 
             for filename in filenames:
-                if fnmatch.fnmatch(filename, pattern):
+                if (
+                    os.path.normcase(filename) == exact_name
+                    if exact_name is not None
+                    else fnmatch.fnmatch(filename, pattern)
+                ):
                     file_path = Path(dirpath) / filename
                     if not self.is_ignored(file_path):
                         yield file_path
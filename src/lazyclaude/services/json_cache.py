@@ -0,0 +1,38 @@
+"""Mtime-keyed cache of parsed JSON config files."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+
+class JsonFileCache:
+    """Parses JSON files once and reuses the result while they are unchanged.
+
+    Callers share the returned objects and must treat them as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[tuple[int, int], Any]] = {}
+
+    def load(self, path: Path) -> Any | None:
+        """
+        Load a JSON file, reusing the parsed data while it is unchanged.
+
+        Args:
+            path: JSON file to read.
+
+        Returns:
+            Parsed data, or None if the file is missing, unreadable or invalid.
+        """
+        try:
+            stat = path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            data = json.loads(path.read_bytes())
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return None
+
+        self._entries[path] = (signature, data)
+        return data
@@ -9,7 +9,8 @@ from lazyclaude.models.marketplace import (
     MarketplacePlugin,
     MarketplaceSource,
 )
-from lazyclaude.services.plugin_loader import PluginLoader
+from lazyclaude.services.filesystem_scanner import scandir_subdirs
+from lazyclaude.services.plugin_loader import PluginLoader, parse_version
 
 
 class MarketplaceLoader:
@@ -40,8 +41,8 @@ class MarketplaceLoader:
             return marketplaces
 
         try:
-            data = json.loads(known_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            data = json.loads(known_file.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             return marketplaces
 
         self._load_installed_plugins()
@@ -92,8 +93,8 @@ class MarketplaceLoader:
             )
 
         try:
-            data = json.loads(marketplace_json.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as e:
+            data = json.loads(marketplace_json.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
             return Marketplace(entry=entry, error=str(e))
 
         plugins: list[MarketplacePlugin] = []
@@ -133,11 +134,7 @@ class MarketplaceLoader:
             is_enabled=is_enabled if is_installed else True,
             install_path=install_path,
             installed_version=installed_version,
-            extra_metadata={
-                k: v
-                for k, v in data.items()
-                if k not in ("name", "description", "source")
-            },
+            raw_data=data,
         )
 
     def _load_installed_plugins(self) -> None:
@@ -145,31 +142,23 @@ class MarketplaceLoader:
         if self._plugin_loader:
             registry = self._plugin_loader.load_registry()
             self._installed_plugin_ids = set(registry.installed.keys())
-            enabled_in_user = {
-                pid for pid, enabled in registry.user_enabled.items() if enabled
-            }
-            enabled_in_project = {
-                pid for pid, enabled in registry.project_enabled.items() if enabled
-            }
-            enabled_in_local = {
-                pid for pid, enabled in registry.local_enabled.items() if enabled
+            enabled_maps = (
+                registry.user_enabled,
+                registry.project_enabled,
+                registry.local_enabled,
+            )
+            # Enabled anywhere wins; installed plugins no settings file
+            # mentions default to enabled.
+            self._enabled_plugin_ids = {
+                pid
+                for enabled_map in enabled_maps
+                for pid, enabled in enabled_map.items()
+                if enabled
             }
-            self._enabled_plugin_ids = (
-                (
-                    self._installed_plugin_ids
-                    - {
-                        pid
-                        for pid, enabled in {
-                            **registry.user_enabled,
-                            **registry.project_enabled,
-                            **registry.local_enabled,
-                        }.items()
-                        if not enabled
-                    }
-                )
-                | enabled_in_user
-                | enabled_in_project
-                | enabled_in_local
+            self._enabled_plugin_ids.update(
+                pid
+                for pid in self._installed_plugin_ids
+                if not any(pid in enabled_map for enabled_map in enabled_maps)
             )
             self._install_paths = {}
             self._installed_versions = {}
@@ -202,22 +191,12 @@ class MarketplaceLoader:
 
     def _find_latest_version_dir(self, parent_dir: Path) -> Path | None:
         """Find the latest version directory in a plugin parent directory."""
-        try:
-            subdirs = [d for d in parent_dir.iterdir() if d.is_dir()]
-            if subdirs:
-                return max(subdirs, key=lambda d: self._parse_version(d.name))
-        except OSError:
-            pass
+        subdirs = scandir_subdirs(parent_dir)
+        if subdirs:
+            latest = max(subdirs, key=lambda d: parse_version(d.name))
+            return Path(latest.path)
         return None
 
-    @staticmethod
-    def _parse_version(version_str: str) -> tuple[int, ...] | tuple[str]:
-        """Parse version string into comparable tuple."""
-        try:
-            return tuple(int(part) for part in version_str.split("."))
-        except ValueError:
-            return (version_str,)
-
     def _find_marketplace(self, marketplace_name: str) -> Marketplace | None:
         """Find a marketplace by name."""
         marketplaces = self.load_marketplaces()
@@ -234,4 +213,4 @@ class MarketplaceLoader:
         self._installed_versions = None
         self._marketplaces_cache = None
         if self._plugin_loader:
-            self._plugin_loader._registry = None
+            self._plugin_loader.refresh()
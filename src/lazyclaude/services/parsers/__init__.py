@@ -2,12 +2,20 @@
 
 import re
 from abc import ABC, abstractmethod
+from dataclasses import fields
 from pathlib import Path
+from typing import Any
 
 import yaml
 
 from lazyclaude.models.customization import ConfigLevel, Customization
 
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+# libyaml's loader is several times faster than the pure-Python one, but
+# PyYAML may be built without it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ICustomizationParser(ABC):
     """Base interface for customization parsers."""
@@ -52,11 +60,10 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
         Tuple of (frontmatter dict, body content).
         If no frontmatter found, returns ({}, original content).
     """
-    pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-    match = re.match(pattern, content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if match:
         try:
-            frontmatter = yaml.safe_load(match.group(1)) or {}
+            frontmatter = yaml.load(match.group(1), Loader=_YamlLoader) or {}
             body = match.group(2)
             return frontmatter, body
         except yaml.YAMLError:
@@ -73,8 +80,14 @@ def parse_tools_list(tools_value: str | list | None) -> list[str]:
     return [t.strip() for t in str(tools_value).split(",") if t.strip()]
 
 
+def metadata_to_dict(metadata: Any) -> dict[str, Any]:
+    """Shallow-convert a metadata dataclass into a Customization metadata dict."""
+    return {f.name: getattr(metadata, f.name) for f in fields(metadata)}
+
+
 __all__ = [
     "ICustomizationParser",
+    "metadata_to_dict",
     "parse_frontmatter",
     "parse_tools_list",
 ]
@@ -2,6 +2,7 @@
 
 import json
 from pathlib import Path
+from typing import Any
 
 from lazyclaude.models.customization import (
     ConfigLevel,
@@ -30,25 +31,28 @@ class HookParser(ICustomizationParser):
         """Check if path is a known hook config file."""
         return path.name in self.HOOK_FILE_NAMES
 
-    def parse(self, path: Path, level: ConfigLevel) -> list[Customization]:  # type: ignore[override]
+    def parse(  # type: ignore[override]
+        self, path: Path, level: ConfigLevel, data: Any | None = None
+    ) -> list[Customization]:
         """
         Parse a configuration file for hooks.
 
         Returns a single Customization if hooks are present, empty list otherwise.
+        Pass already loaded JSON as data to skip reading the file again.
         """
-        try:
-            content = path.read_text(encoding="utf-8")
-            data = json.loads(content)
-        except (OSError, json.JSONDecodeError) as e:
-            return [
-                Customization(
-                    name=path.name,
-                    type=CustomizationType.HOOK,
-                    level=level,
-                    path=path,
-                    error=f"Failed to parse hook config: {e}",
-                )
-            ]
+        if data is None:
+            try:
+                data = json.loads(path.read_bytes())
+            except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+                return [
+                    Customization(
+                        name=path.name,
+                        type=CustomizationType.HOOK,
+                        level=level,
+                        path=path,
+                        error=f"Failed to parse hook config: {e}",
+                    )
+                ]
 
         hooks_data = data.get("hooks", {})
         if not hooks_data:
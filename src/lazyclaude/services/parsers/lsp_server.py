@@ -11,6 +11,10 @@ from lazyclaude.models.customization import (
 )
 from lazyclaude.services.parsers import ICustomizationParser
 
+LSP_FILE_NAME = ".lsp.json"
+
+_TRANSPORT_LABELS = {"stdio": "STDIO", "tcp": "TCP", "ipc": "IPC"}
+
 
 class LSPServerParser(ICustomizationParser):
     """
@@ -21,11 +25,9 @@ class LSPServerParser(ICustomizationParser):
     - {plugin}/.claude-plugin/plugin.json -> lspServers field
     """
 
-    LSP_FILE_NAMES = {".lsp.json"}
-
     def can_parse(self, path: Path) -> bool:
         """Check if path is a known LSP config file."""
-        return path.name in self.LSP_FILE_NAMES
+        return path.name == LSP_FILE_NAME
 
     def parse(self, path: Path, level: ConfigLevel) -> list[Customization]:  # type: ignore[override]
         """
@@ -34,9 +36,8 @@ class LSPServerParser(ICustomizationParser):
         Returns a list of Customization objects, one per language server.
         """
         try:
-            content = path.read_text(encoding="utf-8")
-            data = json.loads(content)
-        except (OSError, json.JSONDecodeError) as e:
+            data = json.loads(path.read_bytes())
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
             return [
                 Customization(
                     name=path.name,
@@ -70,10 +71,11 @@ class LSPServerParser(ICustomizationParser):
         command = server_config.get("command")
         transport = server_config.get("transport", "stdio")
 
+        transport_label = _TRANSPORT_LABELS.get(transport) or transport.upper()
         if command:
-            description = f"{transport.upper()} command: {command}"
+            description = f"{transport_label} command: {command}"
         else:
-            description = f"{transport.upper()} server"
+            description = f"{transport_label} server"
 
         return Customization(
             name=language_name,
@@ -93,9 +95,8 @@ class LSPServerParser(ICustomizationParser):
         Returns an error customization if parsing fails.
         """
         try:
-            content = path.read_text(encoding="utf-8")
-            data = json.loads(content)
-        except (OSError, json.JSONDecodeError) as e:
+            data = json.loads(path.read_bytes())
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
             return [
                 Customization(
                     name=path.name,
@@ -10,7 +10,9 @@ from lazyclaude.models.customization import (
     CustomizationType,
     MCPServerMetadata,
 )
-from lazyclaude.services.parsers import ICustomizationParser
+from lazyclaude.services.parsers import ICustomizationParser, metadata_to_dict
+
+_TRANSPORT_LABELS = {"stdio": "STDIO", "http": "HTTP", "sse": "SSE"}
 
 
 class MCPParser(ICustomizationParser):
@@ -28,25 +30,28 @@ class MCPParser(ICustomizationParser):
         """Check if path is a known MCP config file."""
         return path.name in self.MCP_FILE_NAMES
 
-    def parse(self, path: Path, level: ConfigLevel) -> list[Customization]:  # type: ignore[override]
+    def parse(  # type: ignore[override]
+        self, path: Path, level: ConfigLevel, data: Any | None = None
+    ) -> list[Customization]:
         """
         Parse an MCP configuration file.
 
-        Returns a list of Customization objects, one per server.
+        Returns a list of Customization objects, one per server. Pass already
+        loaded JSON as data to skip reading the file again.
         """
-        try:
-            content = path.read_text(encoding="utf-8")
-            data = json.loads(content)
-        except (OSError, json.JSONDecodeError) as e:
-            return [
-                Customization(
-                    name=path.name,
-                    type=CustomizationType.MCP,
-                    level=level,
-                    path=path,
-                    error=f"Failed to parse MCP config: {e}",
-                )
-            ]
+        if data is None:
+            try:
+                data = json.loads(path.read_bytes())
+            except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+                return [
+                    Customization(
+                        name=path.name,
+                        type=CustomizationType.MCP,
+                        level=level,
+                        path=path,
+                        error=f"Failed to parse MCP config: {e}",
+                    )
+                ]
 
         # .claude.json requires wrapped {"mcpServers": {...}} format
         # .mcp.json and plugin configs support both wrapped {"mcpServers": {...}} and unwrapped {...} formats
@@ -82,12 +87,15 @@ class MCPParser(ICustomizationParser):
         args = server_config.get("args", [])
         env = server_config.get("env", {})
 
+        transport_label = (
+            _TRANSPORT_LABELS.get(transport_type) or transport_type.upper()
+        )
         if transport_type in ("http", "sse") and url:
-            description = f"{transport_type.upper()} server: {url}"
+            description = f"{transport_label} server: {url}"
         elif command:
-            description = f"{transport_type.upper()} command: {command}"
+            description = f"{transport_label} command: {command}"
         else:
-            description = f"{transport_type.upper()} server"
+            description = f"{transport_label} server"
 
         metadata = MCPServerMetadata(
             transport_type=transport_type,
@@ -104,7 +112,7 @@ class MCPParser(ICustomizationParser):
             path=source_path,
             description=description,
             content=json.dumps(server_config, indent=2),
-            metadata=metadata.__dict__,
+            metadata=metadata_to_dict(metadata),
         )
 
     def parse_single(self, path: Path, level: ConfigLevel) -> Customization:
@@ -1,5 +1,6 @@
 """Parser for skill customizations."""
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -10,7 +11,11 @@ from lazyclaude.models.customization import (
     SkillFile,
     SkillMetadata,
 )
-from lazyclaude.services.parsers import ICustomizationParser, parse_frontmatter
+from lazyclaude.services.parsers import (
+    ICustomizationParser,
+    metadata_to_dict,
+    parse_frontmatter,
+)
 
 if TYPE_CHECKING:
     from lazyclaude.services.gitignore_filter import GitignoreFilter
@@ -21,15 +26,15 @@ def _read_skill_files(
     exclude: set[str] | None = None,
     gitignore_filter: "GitignoreFilter | None" = None,
 ) -> list[SkillFile]:
-    """Recursively read all files in a skill directory."""
+    """Recursively list all files in a skill directory (content loads lazily)."""
     if exclude is None:
         exclude = set()
 
     files: list[SkillFile] = []
     try:
-        entries = sorted(
-            directory.iterdir(), key=lambda p: (p.is_file(), p.name.lower())
-        )
+        with os.scandir(directory) as it:
+            # DirEntry type checks reuse the d_type from the directory read.
+            entries = sorted(it, key=lambda e: (e.is_file(), e.name.lower()))
     except OSError:
         return files
 
@@ -37,34 +42,25 @@ def _read_skill_files(
         if entry.name in exclude or entry.name.startswith("."):
             continue
 
+        entry_path = Path(entry.path)
         if entry.is_dir():
             if gitignore_filter and (
                 gitignore_filter.should_skip_dir(entry.name)
-                or gitignore_filter.is_dir_ignored(entry)
+                or gitignore_filter.is_dir_ignored(entry_path)
             ):
                 continue
 
-            children = _read_skill_files(entry, exclude, gitignore_filter)
+            children = _read_skill_files(entry_path, exclude, gitignore_filter)
             files.append(
                 SkillFile(
                     name=entry.name,
-                    path=entry,
+                    path=entry_path,
                     is_directory=True,
                     children=children,
                 )
             )
         elif entry.is_file():
-            try:
-                content = entry.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
-                content = None
-            files.append(
-                SkillFile(
-                    name=entry.name,
-                    path=entry,
-                    content=content,
-                )
-            )
+            files.append(SkillFile(name=entry.name, path=entry_path))
 
     return files
 
@@ -127,12 +123,14 @@ class SkillParser(ICustomizationParser):
             skill_dir, exclude={"SKILL.md"}, gitignore_filter=self._filter
         )
 
+        # Stat each name rather than matching a directory listing, so
+        # case-insensitive filesystems still find e.g. Reference.md.
         metadata = SkillMetadata(
             tags=tags,
-            has_reference=(skill_dir / "reference.md").exists(),
-            has_examples=(skill_dir / "examples.md").exists(),
-            has_scripts=(skill_dir / "scripts").is_dir(),
-            has_templates=(skill_dir / "templates").is_dir(),
+            has_reference=os.path.exists(skill_dir / "reference.md"),
+            has_examples=os.path.exists(skill_dir / "examples.md"),
+            has_scripts=os.path.isdir(skill_dir / "scripts"),
+            has_templates=os.path.isdir(skill_dir / "templates"),
             files=skill_files,
         )
 
@@ -143,5 +141,5 @@ class SkillParser(ICustomizationParser):
             path=path,
             description=description,
             content=content,
-            metadata=metadata.__dict__,
+            metadata=metadata_to_dict(metadata),
         )
@@ -10,6 +10,7 @@ from lazyclaude.models.customization import (
 )
 from lazyclaude.services.parsers import (
     ICustomizationParser,
+    metadata_to_dict,
     parse_frontmatter,
     parse_tools_list,
 )
@@ -70,7 +71,7 @@ class SlashCommandParser(ICustomizationParser):
             path=path,
             description=description,
             content=content,
-            metadata=metadata.__dict__,
+            metadata=metadata_to_dict(metadata),
         )
 
     def _derive_name(self, path: Path) -> str:
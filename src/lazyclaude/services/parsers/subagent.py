@@ -10,6 +10,7 @@ from lazyclaude.models.customization import (
 )
 from lazyclaude.services.parsers import (
     ICustomizationParser,
+    metadata_to_dict,
     parse_frontmatter,
     parse_tools_list,
 )
@@ -75,5 +76,5 @@ class SubagentParser(ICustomizationParser):
             path=path,
             description=description,
             content=content,
-            metadata=metadata.__dict__,
+            metadata=metadata_to_dict(metadata),
         )
@@ -1,11 +1,27 @@
 """Plugin loading and registry management."""
 
-import json
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from lazyclaude.models.customization import PluginInfo, PluginScope
+from lazyclaude.services.filesystem_scanner import scandir_subdirs
+from lazyclaude.services.json_cache import JsonFileCache
+
+
+@lru_cache(maxsize=1024)
+def parse_version(version_str: str) -> tuple[int, ...] | tuple[str]:
+    """Parse version string into comparable tuple.
+
+    Returns tuple of ints for semver (e.g., "1.2.3" -> (1, 2, 3)).
+    Returns tuple with original string for non-semver names.
+    """
+    try:
+        return tuple(int(part) for part in version_str.split("."))
+    except ValueError:
+        return (version_str,)
 
 
 @dataclass
@@ -37,11 +53,16 @@ class PluginLoader:
         user_config_path: Path,
         project_config_path: Path | None = None,
         project_root: Path | None = None,
+        json_cache: JsonFileCache | None = None,
     ) -> None:
         self.user_config_path = user_config_path
         self.project_config_path = project_config_path
         self.project_root = project_root
+        # Shared with discovery so settings.json is parsed once per change.
+        self._json_cache = json_cache or JsonFileCache()
         self._registry: PluginRegistry | None = None
+        self._source_paths: dict[str, Path | None] = {}
+        self._source_indexes: dict[Path, tuple[Any, dict[str, str]]] = {}
 
     def load_registry(self) -> PluginRegistry:
         """Load installed and enabled plugins from configuration files."""
@@ -49,7 +70,7 @@ class PluginLoader:
             return self._registry
 
         v2_file = self.user_config_path / "plugins" / "installed_plugins.json"
-        installed = self._load_v2_plugins(v2_file) if v2_file.is_file() else {}
+        installed = self._load_v2_plugins(v2_file) if os.path.isfile(v2_file) else {}
 
         user_enabled = self._load_json_dict(
             self.user_config_path / "settings.json",
@@ -78,28 +99,26 @@ class PluginLoader:
 
     def _load_v2_plugins(self, path: Path) -> dict[str, list[PluginInstallation]]:
         """Parse V2 format where plugins value is a list."""
-        if not path.is_file():
-            return {}
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            plugins_data = data.get("plugins", {})
-            result: dict[str, list[PluginInstallation]] = {}
-
-            for plugin_id, installations in plugins_data.items():
-                result[plugin_id] = [
-                    PluginInstallation(
-                        scope=inst.get("scope", "user"),
-                        install_path=inst.get("installPath", ""),
-                        version=inst.get("version", "unknown"),
-                        is_local=inst.get("isLocal", False),
-                        project_path=inst.get("projectPath"),
-                    )
-                    for inst in installations
-                ]
-            return result
-        except (json.JSONDecodeError, OSError):
+        data = self._json_cache.load(path)
+        if data is None:
             return {}
 
+        plugins_data = data.get("plugins", {})
+        result: dict[str, list[PluginInstallation]] = {}
+
+        for plugin_id, installations in plugins_data.items():
+            result[plugin_id] = [
+                PluginInstallation(
+                    scope=inst.get("scope", "user"),
+                    install_path=inst.get("installPath", ""),
+                    version=inst.get("version", "unknown"),
+                    is_local=inst.get("isLocal", False),
+                    project_path=inst.get("projectPath"),
+                )
+                for inst in installations
+            ]
+        return result
+
     def get_enabled_plugins(self) -> list[PluginInfo]:
         """Get list of enabled plugin infos with resolved install paths."""
         all_plugins = self.get_all_plugins()
@@ -125,7 +144,7 @@ class PluginLoader:
                     plugin_info = self._create_plugin_info(
                         plugin_id, installation, scope_type="user"
                     )
-                    if plugin_info and plugin_info.install_path.is_dir():
+                    if plugin_info:
                         plugins.append(plugin_info)
 
         # Phase 2: Project-scoped plugins (driven by project settings.json)
@@ -138,7 +157,7 @@ class PluginLoader:
                     plugin_info = self._create_plugin_info(
                         plugin_id, installation, scope_type="project"
                     )
-                    if plugin_info and plugin_info.install_path.is_dir():
+                    if plugin_info:
                         plugins.append(plugin_info)
 
         # Phase 3: Local-scoped plugins (driven by settings.local.json)
@@ -151,7 +170,7 @@ class PluginLoader:
                     plugin_info = self._create_plugin_info(
                         plugin_id, installation, scope_type="local"
                     )
-                    if plugin_info and plugin_info.install_path.is_dir():
+                    if plugin_info:
                         plugins.append(plugin_info)
 
         return plugins
@@ -168,6 +187,7 @@ class PluginLoader:
     def refresh(self) -> None:
         """Clear cached registry to force reload."""
         self._registry = None
+        self._source_paths.clear()
 
     def get_plugin_source_path(self, plugin_id: str) -> Path | None:
         """Get the source path for a plugin.
@@ -185,9 +205,16 @@ class PluginLoader:
         Returns:
             Path to the plugin source, or None if not found
         """
-        parts = plugin_id.split("@") if "@" in plugin_id else [plugin_id]
-        plugin_name = parts[0]
-        marketplace_name = parts[-1] if len(parts) > 1 else None
+        # Resolved on every selection change in the UI, so keep the answer
+        # until the next refresh.
+        if plugin_id not in self._source_paths:
+            self._source_paths[plugin_id] = self._resolve_plugin_source_path(plugin_id)
+        return self._source_paths[plugin_id]
+
+    def _resolve_plugin_source_path(self, plugin_id: str) -> Path | None:
+        """Resolve a plugin's source path without consulting the memo."""
+        plugin_name, sep, _ = plugin_id.partition("@")
+        marketplace_name = plugin_id.rpartition("@")[2] if sep else None
 
         if marketplace_name:
             marketplace_info = self._load_marketplace_info(marketplace_name)
@@ -226,50 +253,58 @@ class PluginLoader:
             Resolved absolute path to the plugin source, or None if not found
         """
         marketplace_json = marketplace_root / ".claude-plugin" / "marketplace.json"
-        if not marketplace_json.is_file():
+        data = self._json_cache.load(marketplace_json)
+        if data is None:
             return marketplace_root
 
-        try:
-            data = json.loads(marketplace_json.read_text(encoding="utf-8"))
-            plugins = data.get("plugins", [])
-
-            for plugin in plugins:
-                if plugin.get("name") == plugin_name:
-                    source_relative: str = plugin.get("source", "")
-                    if source_relative:
-                        resolved = (marketplace_root / source_relative).resolve()
-                        if resolved.is_dir():
-                            return resolved
-
-        except (json.JSONDecodeError, OSError):
-            pass
+        source_relative = self._plugin_source_index(marketplace_json, data).get(
+            plugin_name
+        )
+        if source_relative:
+            # normpath folds "./plugins/x" without the per-component lstat of
+            # resolve(); symlinks are followed when the path is opened anyway.
+            resolved = Path(os.path.normpath(marketplace_root / source_relative))
+            if os.path.isdir(resolved):
+                return resolved
 
         return marketplace_root
 
+    def _plugin_source_index(
+        self, marketplace_json: Path, data: dict[str, Any]
+    ) -> dict[str, str]:
+        """Map plugin names to relative sources, rebuilt when the file is reparsed."""
+        cached = self._source_indexes.get(marketplace_json)
+        # The JSON cache hands back the same object until the file changes.
+        if cached is not None and cached[0] is data:
+            return cached[1]
+
+        index: dict[str, str] = {}
+        for plugin in data.get("plugins", []):
+            name = plugin.get("name")
+            source = plugin.get("source")
+            if name and isinstance(source, str) and source:
+                index.setdefault(name, source)
+        self._source_indexes[marketplace_json] = (data, index)
+        return index
+
     def _load_marketplace_info(self, marketplace_name: str) -> dict[str, Any] | None:
         """Load marketplace info from known_marketplaces.json."""
         marketplaces_file = (
             self.user_config_path / "plugins" / "known_marketplaces.json"
         )
-        if not marketplaces_file.is_file():
-            return None
-        try:
-            data = json.loads(marketplaces_file.read_text(encoding="utf-8"))
-            result: dict[str, Any] | None = data.get(marketplace_name)
-            return result
-        except (json.JSONDecodeError, OSError):
+        data = self._json_cache.load(marketplaces_file)
+        if data is None:
             return None
+        result: dict[str, Any] | None = data.get(marketplace_name)
+        return result
 
     def _load_json_dict(self, path: Path, key: str) -> dict[str, Any]:
         """Generic JSON dict loader with error handling."""
-        if not path.is_file():
-            return {}
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            result: dict[str, Any] = data.get(key, {})
-            return result
-        except (json.JSONDecodeError, OSError):
+        data = self._json_cache.load(path)
+        if data is None:
             return {}
+        result: dict[str, Any] = data.get(key, {})
+        return result
 
     def _create_plugin_info(
         self,
@@ -283,15 +318,22 @@ class PluginLoader:
             plugin_id: Plugin identifier
             installation: Installation data from registry
             scope_type: One of "user", "project", or "local"
+
+        Returns:
+            PluginInfo, or None if the plugin has no install directory on disk
         """
         if not installation.install_path:
             return None
 
-        short_name = plugin_id.split("@")[0] if "@" in plugin_id else plugin_id
+        short_name = plugin_id.partition("@")[0]
         install_path = Path(installation.install_path)
         version = installation.version
 
-        if not install_path.is_dir() and install_path.parent.is_dir():
+        # The resolved path is always an existing directory, so callers need
+        # not stat it again.
+        if not os.path.isdir(install_path):
+            if not os.path.isdir(install_path.parent):
+                return None
             install_path = self._find_latest_version_dir(install_path.parent)
             version = install_path.name
 
@@ -332,22 +374,8 @@ class PluginLoader:
         Uses semantic version comparison (e.g., "10.0.0" > "2.0.0").
         Falls back to string comparison for non-semver directory names.
         """
-        try:
-            subdirs = [d for d in parent_dir.iterdir() if d.is_dir()]
-            if subdirs:
-                return max(subdirs, key=lambda d: self._parse_version(d.name))
-        except OSError:
-            pass
+        subdirs = scandir_subdirs(parent_dir)
+        if subdirs:
+            latest = max(subdirs, key=lambda d: parse_version(d.name))
+            return Path(latest.path)
         return parent_dir
-
-    @staticmethod
-    def _parse_version(version_str: str) -> tuple[int, ...] | tuple[str]:
-        """Parse version string into comparable tuple.
-
-        Returns tuple of ints for semver (e.g., "1.2.3" -> (1, 2, 3)).
-        Returns tuple with original string for non-semver names.
-        """
-        try:
-            return tuple(int(part) for part in version_str.split("."))
-        except ValueError:
-            return (version_str,)
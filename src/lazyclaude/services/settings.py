@@ -41,7 +41,7 @@ class SettingsService:
             return AppSettings()
 
         try:
-            data = json.loads(self._settings_path.read_text(encoding="utf-8"))
+            data = json.loads(self._settings_path.read_bytes())
             return AppSettings(
                 theme=data.get("theme", AppSettings.theme),
                 marketplace_auto_collapse=data.get(
@@ -50,7 +50,7 @@ class SettingsService:
                 ),
                 suggested_marketplaces=data.get("suggested_marketplaces", {}),
             )
-        except (json.JSONDecodeError, OSError):
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             return AppSettings()
 
     def save(self, settings: AppSettings) -> None:
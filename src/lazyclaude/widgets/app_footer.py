@@ -1,5 +1,7 @@
 """Custom application footer with dynamic filter highlighting."""
 
+from typing import ClassVar
+
 from textual.app import ComposeResult
 from textual.reactive import reactive
 from textual.widget import Widget
@@ -7,6 +9,8 @@ from textual.widgets import Static
 
 from lazyclaude.widgets.helpers.rendering import format_keybinding
 
+_LEVEL_FILTER_KEYS = (("a", "All"), ("u", "User"), ("p", "Project"), ("P", "Plugin"))
+
 
 class AppFooter(Widget):
     """Footer widget that highlights active filters."""
@@ -39,10 +43,40 @@ class AppFooter(Widget):
     can_move: reactive[bool] = reactive(False)
     can_delete: reactive[bool] = reactive(False)
 
+    # Rendered text per reactive state; every footer shares the same layout.
+    _TEXT_CACHE: ClassVar[dict[tuple[str | bool, ...], str]] = {}
+
+    _rendered_text: str = ""
+
     def compose(self) -> ComposeResult:
-        yield Static(self._get_footer_text(), classes="footer-content")
+        self._rendered_text = self._get_footer_text()
+        yield Static(self._rendered_text, classes="footer-content")
+
+    def _footer_state(self) -> tuple[str | bool, ...]:
+        """Collect every reactive the footer text depends on."""
+        return (
+            self.filter_level,
+            self.search_active,
+            self.disabled_filter_active,
+            self.preview_mode,
+            self.marketplace_modal_visible,
+            self.can_refresh,
+            self.can_edit,
+            self.can_copy,
+            self.can_move,
+            self.can_delete,
+        )
 
     def _get_footer_text(self) -> str:
+        """Return footer text for the current state, rendering it on first use."""
+        key = self._footer_state()
+        text = self._TEXT_CACHE.get(key)
+        if text is None:
+            text = self._render_footer_text()
+            self._TEXT_CACHE[key] = text
+        return text
+
+    def _render_footer_text(self) -> str:
         """Render footer with highlighted active filters."""
         parts = ["[bold]q[/] Quit", "[bold]?[/] Help"]
 
@@ -61,20 +95,13 @@ class AppFooter(Widget):
 
         # Filter keys (hidden when marketplace modal is visible or in preview mode)
         if not self.marketplace_modal_visible and not self.preview_mode:
-            all_key = format_keybinding("a", "All", active=self.filter_level == "All")
-            user_key = format_keybinding(
-                "u", "User", active=self.filter_level == "User"
-            )
-            project_key = format_keybinding(
-                "p", "Project", active=self.filter_level == "Project"
-            )
-            plugin_key = format_keybinding(
-                "P", "Plugin", active=self.filter_level == "Plugin"
+            parts.extend(
+                format_keybinding(key, level, active=self.filter_level == level)
+                for key, level in _LEVEL_FILTER_KEYS
             )
-            disabled_key = format_keybinding(
-                "D", "Disabled", active=self.disabled_filter_active
+            parts.append(
+                format_keybinding("D", "Disabled", active=self.disabled_filter_active)
             )
-            parts.extend([all_key, user_key, project_key, plugin_key, disabled_key])
 
         # Search (always visible)
         search_key = format_keybinding("/", "Search", active=self.search_active)
@@ -94,9 +121,15 @@ class AppFooter(Widget):
     def _update_content(self) -> None:
         """Update the footer content display."""
         if self.is_mounted:
+            text = self._get_footer_text()
+            # Several reactives flip together on selection changes; skip the
+            # re-render when they net out to the same text.
+            if text == self._rendered_text:
+                return
             try:
                 content = self.query_one(".footer-content", Static)
-                content.update(self._get_footer_text())
+                content.update(text)
+                self._rendered_text = text
             except Exception:
                 pass
 
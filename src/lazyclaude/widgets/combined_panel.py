@@ -1,14 +1,14 @@
 """CombinedPanel widget for displaying multiple types in a tabbed view."""
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, cast
 
-from textual.app import ComposeResult
 from textual.binding import Binding
-from textual.containers import VerticalScroll
 from textual.dom import DOMNode
 from textual.events import Click
 from textual.message import Message
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Static
 
@@ -20,10 +20,14 @@ from lazyclaude.models.customization import (
     CustomizationType,
     MemoryFileRef,
 )
-from lazyclaude.widgets.helpers import build_memory_flat_items, render_memory_item
+from lazyclaude.widgets.helpers import (
+    PanelRowsMixin,
+    build_memory_flat_items,
+    render_memory_item,
+)
 
 
-class CombinedPanel(Widget):
+class CombinedPanel(PanelRowsMixin, Widget):
     """Panel displaying multiple customization types with tab switching."""
 
     COMBINED_TYPES = [
@@ -144,6 +148,16 @@ class CombinedPanel(Widget):
         self._memory_flat_items: list[
             tuple[Customization, MemoryFileRef | None, int]
         ] = []
+        self._by_type: dict[CustomizationType, list[Customization]] = {
+            ctype: [] for ctype in self.COMBINED_TYPES
+        }
+        self._pending_buckets: (
+            tuple[list[Customization], dict[CustomizationType, list[Customization]]]
+            | None
+        ) = None
+        self._item_widgets: list[Static] = []
+        self._row_texts: list[str] = []
+        self._selection_timer: Timer | None = None
 
     @property
     def _is_memory_mode(self) -> bool:
@@ -153,7 +167,7 @@ class CombinedPanel(Widget):
     @property
     def _filtered_customizations(self) -> list[Customization]:
         """Get customizations filtered by active type."""
-        return [c for c in self.customizations if c.type == self.active_type]
+        return self._by_type.get(self.active_type, [])
 
     def _item_count(self) -> int:
         """Get the number of items in the current view."""
@@ -174,36 +188,20 @@ class CombinedPanel(Widget):
             return filtered[self.selected_index]
         return None
 
-    def compose(self) -> ComposeResult:
-        """Compose the panel content."""
-        with VerticalScroll(classes="items-container"):
-            if self._is_memory_mode:
-                if not self._memory_flat_items:
-                    yield Static("[dim italic]No items[/]", classes="empty-message")
-                else:
-                    for i, (memory, ref, depth) in enumerate(self._memory_flat_items):
-                        yield Static(
-                            render_memory_item(
-                                i,
-                                memory,
-                                ref,
-                                depth,
-                                selected_index=self.selected_index,
-                                is_active=self.is_active,
-                                expanded_keys=self.expanded_memory_files,
-                            ),
-                            classes="item",
-                            id=f"item-{i}",
-                        )
-            else:
-                filtered = self._filtered_customizations
-                if not filtered:
-                    yield Static("[dim italic]No items[/]", classes="empty-message")
-                else:
-                    for i, item in enumerate(filtered):
-                        yield Static(
-                            self._render_item(i, item), classes="item", id=f"item-{i}"
-                        )
+    def _render_row(self, index: int) -> str:
+        """Render the row at index for the active tab."""
+        if self._is_memory_mode:
+            memory, ref, depth = self._memory_flat_items[index]
+            return render_memory_item(
+                index,
+                memory,
+                ref,
+                depth,
+                selected_index=self.selected_index,
+                is_active=self.is_active,
+                expanded_keys=self.expanded_memory_files,
+            )
+        return self._render_item(index, self._filtered_customizations[index])
 
     def _render_header(self) -> str:
         """Render the tab-style header."""
@@ -232,13 +230,21 @@ class CombinedPanel(Widget):
 
     def _rebuild_memory_flat_items(self) -> None:
         """Build flat list of items for memory mode (with expanded refs)."""
-        memory_customizations = [
-            c for c in self.customizations if c.type == CustomizationType.MEMORY_FILE
-        ]
         self._memory_flat_items = build_memory_flat_items(
-            memory_customizations, self.expanded_memory_files
+            self._by_type[CustomizationType.MEMORY_FILE], self.expanded_memory_files
         )
 
+    def _rebuild_type_buckets(self) -> None:
+        """Group customizations by type in a single pass."""
+        by_type: dict[CustomizationType, list[Customization]] = {
+            ctype: [] for ctype in self.COMBINED_TYPES
+        }
+        for c in self.customizations:
+            bucket = by_type.get(c.type)
+            if bucket is not None:
+                bucket.append(c)
+        self._by_type = by_type
+
     def watch_active_type(
         self, old_type: CustomizationType, new_type: CustomizationType
     ) -> None:
@@ -250,8 +256,7 @@ class CombinedPanel(Widget):
             self._rebuild_memory_flat_items()
             count = len(self._memory_flat_items)
         else:
-            filtered = [c for c in self.customizations if c.type == new_type]
-            count = len(filtered)
+            count = len(self._by_type.get(new_type, []))
 
         if count > 0 and restored_index >= count:
             restored_index = count - 1
@@ -266,8 +271,15 @@ class CombinedPanel(Widget):
             if self.is_active:
                 self._emit_selection_message()
 
-    def watch_customizations(self, customizations: list[Customization]) -> None:  # noqa: ARG002
+    def watch_customizations(self, customizations: list[Customization]) -> None:
         """React to customizations list changes."""
+        # set_customizations may already have received the items grouped.
+        pending = self._pending_buckets
+        if pending is not None and pending[0] is customizations:
+            self._by_type = pending[1]
+            self._pending_buckets = None
+        else:
+            self._rebuild_type_buckets()
         if self._is_memory_mode:
             self._rebuild_memory_flat_items()
             count = len(self._memory_flat_items)
@@ -284,79 +296,6 @@ class CombinedPanel(Widget):
             if self.is_active:
                 self._emit_selection_message()
 
-    def watch_selected_index(self, index: int) -> None:  # noqa: ARG002
-        """React to selected index changes."""
-        if self.is_mounted:
-            self.border_subtitle = self._render_footer()
-        self._refresh_display()
-        self._scroll_to_selection()
-        self._emit_selection_message()
-
-    async def _rebuild_items(self, *, scroll_to_selection: bool = False) -> None:
-        """Rebuild item widgets when customizations change."""
-        if not self.is_mounted:
-            return
-        container = self.query_one(".items-container", VerticalScroll)
-        await container.remove_children()
-
-        if self._is_memory_mode:
-            if not self._memory_flat_items:
-                await container.mount(
-                    Static("[dim italic]No items[/]", classes="empty-message")
-                )
-            else:
-                for i, (memory, ref, depth) in enumerate(self._memory_flat_items):
-                    is_selected = i == self.selected_index and self.is_active
-                    classes = "item item-selected" if is_selected else "item"
-                    await container.mount(
-                        Static(
-                            render_memory_item(
-                                i,
-                                memory,
-                                ref,
-                                depth,
-                                selected_index=self.selected_index,
-                                is_active=self.is_active,
-                                expanded_keys=self.expanded_memory_files,
-                            ),
-                            classes=classes,
-                            id=f"item-{i}",
-                        )
-                    )
-        else:
-            filtered = self._filtered_customizations
-            if not filtered:
-                await container.mount(
-                    Static("[dim italic]No items[/]", classes="empty-message")
-                )
-            else:
-                for i, item in enumerate(filtered):
-                    is_selected = i == self.selected_index and self.is_active
-                    classes = "item item-selected" if is_selected else "item"
-                    await container.mount(
-                        Static(
-                            self._render_item(i, item), classes=classes, id=f"item-{i}"
-                        )
-                    )
-
-        if scroll_to_selection:
-            self._scroll_selection_to_top()
-        else:
-            container.scroll_home(animate=False)
-        self._update_empty_state()
-
-    def _scroll_selection_to_top(self) -> None:
-        """Scroll so the selected item is at the top of the container."""
-        try:
-            container = self.query_one(".items-container", VerticalScroll)
-            container.scroll_to(y=self.selected_index, animate=False)
-        except Exception:
-            pass
-
-    async def _rebuild_items_and_scroll(self) -> None:
-        """Rebuild items and scroll selection to top."""
-        await self._rebuild_items(scroll_to_selection=True)
-
     def on_mount(self) -> None:
         """Handle mount event."""
         self.border_title = self._render_header()
@@ -366,51 +305,6 @@ class CombinedPanel(Widget):
                 self._rebuild_memory_flat_items()
             self.call_later(self._rebuild_items)
 
-    def _refresh_display(self) -> None:
-        """Refresh the panel display (updates existing widgets)."""
-        try:
-            items = list(self.query("Static.item"))
-            if self._is_memory_mode:
-                for i, (item_widget, (memory, ref, depth)) in enumerate(
-                    zip(items, self._memory_flat_items, strict=False)
-                ):
-                    if isinstance(item_widget, Static):
-                        item_widget.update(
-                            render_memory_item(
-                                i,
-                                memory,
-                                ref,
-                                depth,
-                                selected_index=self.selected_index,
-                                is_active=self.is_active,
-                                expanded_keys=self.expanded_memory_files,
-                            )
-                        )
-                    is_selected = i == self.selected_index and self.is_active
-                    item_widget.set_class(is_selected, "item-selected")
-            else:
-                filtered = self._filtered_customizations
-                for i, (item_widget, item) in enumerate(
-                    zip(items, filtered, strict=False)
-                ):
-                    if isinstance(item_widget, Static):
-                        item_widget.update(self._render_item(i, item))
-                    is_selected = i == self.selected_index and self.is_active
-                    item_widget.set_class(is_selected, "item-selected")
-        except Exception:
-            pass
-
-    def _scroll_to_selection(self) -> None:
-        """Scroll to keep the selected item visible."""
-        if self._item_count() == 0:
-            return
-        try:
-            items = list(self.query(".item"))
-            if 0 <= self.selected_index < len(items):
-                items[self.selected_index].scroll_visible(animate=False)
-        except Exception:
-            pass
-
     def on_click(self, event: Click) -> None:
         """Handle click - select clicked item and focus panel."""
         self.focus()
@@ -434,17 +328,6 @@ class CombinedPanel(Widget):
                 break
             current = current.parent
 
-    def on_focus(self) -> None:
-        """Handle focus event."""
-        self.is_active = True
-        self._refresh_display()
-        self._emit_selection_message()
-
-    def on_blur(self) -> None:
-        """Handle blur event."""
-        self.is_active = False
-        self._refresh_display()
-
     def action_cursor_down(self) -> None:
         """Move selection down."""
         count = self._item_count()
@@ -554,10 +437,24 @@ class CombinedPanel(Widget):
         """Delegate to app's back action."""
         await cast("LazyClaude", self.app).action_back()
 
-    def set_customizations(self, customizations: list[Customization]) -> None:
-        """Set the customizations for this panel (all types, filtering done internally)."""
-        filtered = [c for c in customizations if c.type in self.COMBINED_TYPES]
-        self.customizations = filtered
+    def set_customizations(
+        self,
+        customizations: list[Customization],
+        by_type: Mapping[CustomizationType, list[Customization]] | None = None,
+    ) -> None:
+        """
+        Set the customizations for this panel.
+
+        Args:
+            customizations: Items of the combined types, grouped in tab order.
+            by_type: The same items already bucketed by type, if available.
+        """
+        if by_type is not None:
+            self._pending_buckets = (
+                customizations,
+                {ctype: by_type[ctype] for ctype in self.COMBINED_TYPES},
+            )
+        self.customizations = customizations
         if self._is_memory_mode:
             self._rebuild_memory_flat_items()
         self._update_empty_state()
@@ -1,10 +1,11 @@
 """MainPane widget for displaying customization details."""
 
 import re
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rich.console import Group, RenderableType
-from rich.syntax import Syntax
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.reactive import reactive
@@ -13,6 +14,10 @@ from textual.widgets import Static
 
 from lazyclaude.models.customization import Customization, MemoryFileRef
 
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer  # type: ignore[import-untyped]
+    from rich.syntax import SyntaxTheme
+
 TEXTUAL_TO_PYGMENTS_THEME: dict[str, str] = {
     "lazygit": "native",
     "catppuccin-latte": "default",
@@ -31,6 +36,54 @@ TEXTUAL_TO_PYGMENTS_THEME: dict[str, str] = {
 
 DEFAULT_SYNTAX_THEME = "monokai"
 
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+_MAX_HIGHLIGHT_CHARS = 64_000
+
+_SUFFIX_LEXERS: dict[str, str] = {
+    ".md": "markdown",
+    ".json": "json",
+    ".py": "python",
+    ".sh": "bash",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".js": "javascript",
+    ".ts": "typescript",
+}
+
+
+# rich.syntax and Pygments take ~20ms to import, so the helpers below load
+# them on the first highlight rather than delaying the first frame.
+@cache
+def _get_lexer(name: str) -> "Lexer":
+    """Return a shared Pygments lexer configured the way rich's Syntax would.
+
+    Syntax looks a lexer name up again on every highlight; lexers keep no
+    state between runs, so one instance per name can be reused.
+    """
+    from pygments.lexers import get_lexer_by_name  # type: ignore[import-untyped]
+
+    return get_lexer_by_name(name, stripnl=False, ensurenl=True, tabsize=4)
+
+
+@cache
+def _get_pygments_theme(name: str) -> "SyntaxTheme":
+    """Return a shared Syntax theme for a Pygments style name.
+
+    Syntax resolves a theme name to a new style object on every construction;
+    a shared one also keeps its per-token style cache between renders.
+    """
+    from rich.syntax import Syntax
+
+    return Syntax.get_theme(name)
+
+
+def _highlight(code: str, lexer: str, theme: "SyntaxTheme") -> RenderableType:
+    """Build a word-wrapped Syntax renderable for code."""
+    from rich.syntax import Syntax
+
+    return Syntax(code, _get_lexer(lexer), theme=theme, word_wrap=True)
+
 
 class MainPane(Widget):
     """Main pane with switchable content/metadata views."""
@@ -85,6 +138,10 @@ class MainPane(Widget):
     selected_file: reactive[Path | None] = reactive(None)
     selected_ref: reactive[MemoryFileRef | None] = reactive(None)
 
+    _displayed_state: tuple[object, ...] | None = None
+    _accent: str | None = None
+    _last_theme: str | None = None
+
     def compose(self) -> ComposeResult:
         """Compose the pane content."""
         yield Static(self._get_renderable(), classes="pane-content")
@@ -134,15 +191,16 @@ class MainPane(Widget):
             lines.append(f"[red]Error:[/] {c.error}")
         return "\n".join(lines)
 
-    def _get_syntax_theme(self) -> str:
+    def _get_syntax_theme(self) -> "SyntaxTheme":
         """Get Pygments theme based on current app theme."""
         app_theme = self.app.theme or "textual-dark"
-        return TEXTUAL_TO_PYGMENTS_THEME.get(app_theme, DEFAULT_SYNTAX_THEME)
+        return _get_pygments_theme(
+            TEXTUAL_TO_PYGMENTS_THEME.get(app_theme, DEFAULT_SYNTAX_THEME)
+        )
 
     def _extract_frontmatter_text(self, content: str) -> tuple[str | None, str]:
         """Extract raw frontmatter text and body from markdown content."""
-        pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-        match = re.match(pattern, content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content)
         if match:
             return match.group(1), match.group(2)
         return None, content
@@ -154,13 +212,13 @@ class MainPane(Widget):
 
         if frontmatter_text:
             parts: list[RenderableType] = [
-                Syntax(frontmatter_text, "yaml", theme=theme, word_wrap=True),
+                _highlight(frontmatter_text, "yaml", theme),
                 "",
-                Syntax(body, "markdown", theme=theme, word_wrap=True),
+                _highlight(body, "markdown", theme),
             ]
             return Group(*parts)
 
-        return Syntax(content, "markdown", theme=theme, word_wrap=True)
+        return _highlight(content, "markdown", theme)
 
     def _render_file_content(self) -> RenderableType:
         """Render file content view with syntax highlighting."""
@@ -179,18 +237,8 @@ class MainPane(Widget):
             return "[dim italic]Empty[/]"
 
         suffix = self.customization.path.suffix.lower()
-        if suffix == ".md":
-            return self._render_markdown_with_frontmatter(content)
-
-        lexer_map = {".json": "json"}
-        lexer = lexer_map.get(suffix, "text")
-
-        return Syntax(
-            content,
-            lexer,
-            theme=self._get_syntax_theme(),
-            word_wrap=True,
-        )
+        lexer_map = {".md": "markdown", ".json": "json"}
+        return self._render_code(content, lexer_map.get(suffix, "text"))
 
     def _render_selected_file(self) -> RenderableType:
         """Render content of a selected file (from skill tree)."""
@@ -209,29 +257,8 @@ class MainPane(Widget):
         if not content:
             return "[dim italic]Empty file[/]"
 
-        suffix = path.suffix.lower()
-        theme = self._get_syntax_theme()
-
-        lexer_map = {
-            ".md": "markdown",
-            ".json": "json",
-            ".py": "python",
-            ".sh": "bash",
-            ".yaml": "yaml",
-            ".yml": "yaml",
-            ".js": "javascript",
-            ".ts": "typescript",
-        }
-        lexer = lexer_map.get(suffix, "text")
-
-        if suffix == ".md":
-            return self._render_markdown_with_frontmatter(content)
-
-        return Syntax(
-            content,
-            lexer,
-            theme=theme,
-            word_wrap=True,
+        return self._render_code(
+            content, _SUFFIX_LEXERS.get(path.suffix.lower(), "text")
         )
 
     def _render_selected_ref(self) -> RenderableType:
@@ -247,43 +274,59 @@ class MainPane(Widget):
             return "[dim italic]Empty file[/]"
 
         suffix = ref.path.suffix.lower() if ref.path else ".md"
-        theme = self._get_syntax_theme()
+        return self._render_code(ref.content, _SUFFIX_LEXERS.get(suffix, "text"))
+
+    def _render_code(self, content: str, lexer: str) -> RenderableType:
+        """Highlight file content, clipping very large files."""
+        # Highlighting cost grows with the whole file, not the visible part,
+        # so huge files would stall every redraw.
+        truncated = len(content) > _MAX_HIGHLIGHT_CHARS
+        if truncated:
+            cut = content.rfind("\n", 0, _MAX_HIGHLIGHT_CHARS)
+            content = content[: cut if cut > 0 else _MAX_HIGHLIGHT_CHARS]
+
+        renderable: RenderableType
+        if lexer == "markdown":
+            renderable = self._render_markdown_with_frontmatter(content)
+        else:
+            renderable = _highlight(content, lexer, self._get_syntax_theme())
 
-        lexer_map = {
-            ".md": "markdown",
-            ".json": "json",
-            ".py": "python",
-            ".sh": "bash",
-            ".yaml": "yaml",
-            ".yml": "yaml",
-            ".js": "javascript",
-            ".ts": "typescript",
-        }
-        lexer = lexer_map.get(suffix, "text")
-
-        if suffix == ".md":
-            return self._render_markdown_with_frontmatter(ref.content)
-
-        return Syntax(
-            ref.content,
-            lexer,
-            theme=theme,
-            word_wrap=True,
-        )
+        if truncated:
+            return Group(
+                renderable,
+                "",
+                f"[dim italic]Showing the first {len(content):,} characters[/]",
+            )
+        return renderable
 
     def on_mount(self) -> None:
         """Handle mount event."""
         self._update_title()
         self.border_subtitle = self._render_footer()
+        self._last_theme = self.app.theme
         self.watch(self.app, "theme", self._on_theme_changed)
 
     def _on_theme_changed(self) -> None:
         """Handle app theme changes."""
+        # The watcher also fires on registration and on re-assignment of the
+        # current theme; neither changes what is shown.
+        if self.app.theme == self._last_theme:
+            return
+        self._last_theme = self.app.theme
+        self._accent = None
+        self._update_title()
         self._refresh_display()
 
+    def _get_accent(self) -> str:
+        """Get the theme accent color, resolving CSS variables once per theme."""
+        # get_css_variables rebuilds the whole theme palette (~0.75ms).
+        if self._accent is None:
+            self._accent = self.app.get_css_variables().get("accent", "cyan")
+        return self._accent
+
     def _update_title(self) -> None:
         """Update border title based on view mode."""
-        accent = self.app.get_css_variables().get("accent", "cyan")
+        accent = self._get_accent()
         if self.view_mode == "content":
             tabs = f"[bold {accent}]Content[/] - Metadata"
         else:
@@ -343,8 +386,23 @@ class MainPane(Widget):
     def _refresh_display(self) -> None:
         """Refresh the pane display."""
         try:
+            state = (
+                self.view_mode,
+                self.customization,
+                self.selected_file,
+                self.selected_ref,
+                self.display_path,
+                self._get_syntax_theme(),
+            )
+            # Selecting a customization also resets the selected file and ref,
+            # and several app themes share a Pygments style. Highlighting is
+            # the expensive part of a redraw, so skip it when nothing shown
+            # would change.
+            if state == self._displayed_state:
+                return
             content = self.query_one(".pane-content", Static)
             content.update(self._get_renderable())
+            self._displayed_state = state
         except Exception:
             pass
 
@@ -1,9 +1,15 @@
 """Helper functions for widget rendering."""
 
+from lazyclaude.widgets.helpers.panel_rows import PanelRowsMixin
 from lazyclaude.widgets.helpers.rendering import (
     MemoryFlatItem,
     build_memory_flat_items,
     render_memory_item,
 )
 
-__all__ = ["MemoryFlatItem", "build_memory_flat_items", "render_memory_item"]
+__all__ = [
+    "MemoryFlatItem",
+    "PanelRowsMixin",
+    "build_memory_flat_items",
+    "render_memory_item",
+]
@@ -0,0 +1,213 @@
+"""Row syncing and selection announcing shared by the list panels."""
+
+from abc import abstractmethod
+from typing import TYPE_CHECKING
+
+from textual.app import ComposeResult
+from textual.containers import VerticalScroll
+from textual.timer import Timer
+from textual.widget import Widget
+from textual.widgets import Static
+
+if TYPE_CHECKING:
+    _PanelBase = Widget
+else:
+    _PanelBase = object
+
+
+class PanelRowsMixin(_PanelBase):
+    """Mixin keeping a panel's item rows and selection announcements in sync.
+
+    The panel renders rows through ``_item_count``/``_render_row`` and owns the
+    ``_item_widgets``, ``_row_texts`` and ``_selection_timer`` state.
+    """
+
+    _SELECTION_FLUSH_SECONDS = 0.03
+
+    _items_container: VerticalScroll
+    _item_widgets: list[Static]
+    _row_texts: list[str]
+    _selection_timer: Timer | None
+    selected_index: int
+    is_active: bool
+
+    @abstractmethod
+    def _item_count(self) -> int:
+        """Return the number of rows the panel currently shows."""
+        ...
+
+    @abstractmethod
+    def _render_row(self, index: int) -> str:
+        """Render the row at index."""
+        ...
+
+    @abstractmethod
+    def _render_footer(self) -> str:
+        """Render the border subtitle for the current selection."""
+        ...
+
+    @abstractmethod
+    def _emit_selection_message(self) -> None:
+        """Post the message announcing the current selection."""
+        ...
+
+    @abstractmethod
+    def _update_empty_state(self) -> None:
+        """Toggle the panel's empty styling."""
+        ...
+
+    def compose(self) -> ComposeResult:
+        """Compose the panel content."""
+        self._items_container = VerticalScroll(classes="items-container")
+        with self._items_container:
+            rows = self._render_rows()
+            self._row_texts = rows
+            if not rows:
+                yield Static("[dim italic]No items[/]", classes="empty-message")
+            else:
+                self._item_widgets = [
+                    Static(text, classes="item", id=f"item-{i}")
+                    for i, text in enumerate(rows)
+                ]
+                yield from self._item_widgets
+
+    def _render_rows(self) -> list[str]:
+        """Render every row for the panel's current view."""
+        return [self._render_row(i) for i in range(self._item_count())]
+
+    def watch_selected_index(self, old_index: int, index: int) -> None:
+        """React to selected index changes."""
+        if self.is_mounted:
+            self.border_subtitle = self._render_footer()
+        # Only the rows losing and gaining the cursor change.
+        self._refresh_rows(old_index, index)
+        self._scroll_to_selection()
+        if not self.is_mounted:
+            self._emit_selection_message()
+        elif self._selection_timer is not None:
+            # Held j/k repeats faster than the detail pane can re-render;
+            # announce only the selection the cursor settles on.
+            self._selection_timer.reset()
+        else:
+            self._selection_timer = self.set_timer(
+                self._SELECTION_FLUSH_SECONDS, self._flush_selection
+            )
+
+    def _flush_selection(self) -> None:
+        """Announce the selection after a burst of cursor moves."""
+        self._selection_timer = None
+        # Focus may have moved on while the timer ran; the newly focused
+        # panel already owns the main pane.
+        if self.is_active:
+            self._emit_selection_message()
+
+    async def _rebuild_items(self, *, scroll_to_selection: bool = False) -> None:
+        """Sync item widgets with the current rows, reusing mounted ones."""
+        if not self.is_mounted:
+            return
+        container = self._items_container
+        rows = self._render_rows()
+        widgets = self._item_widgets
+        texts = self._row_texts
+
+        if not rows or not widgets:
+            # Entering or leaving the "No items" placeholder.
+            await container.remove_children()
+            widgets.clear()
+            texts.clear()
+            if not rows:
+                await container.mount(
+                    Static("[dim italic]No items[/]", classes="empty-message")
+                )
+
+        # Filtering, expanding and tab switches usually keep most rows, so
+        # update the overlap in place and only mount or remove the difference.
+        for i, (widget, text) in enumerate(zip(widgets, rows, strict=False)):
+            # Re-announced lists mostly render the same rows; updating a
+            # Static forces a layout pass even when its text is unchanged.
+            if text != texts[i]:
+                widget.update(text)
+                texts[i] = text
+            widget.set_class(
+                i == self.selected_index and self.is_active, "item-selected"
+            )
+        if len(widgets) > len(rows):
+            stale = widgets[len(rows) :]
+            del widgets[len(rows) :]
+            del texts[len(rows) :]
+            await container.remove_children(stale)
+        elif len(rows) > len(widgets):
+            added = [
+                Static(
+                    text,
+                    classes="item item-selected"
+                    if i == self.selected_index and self.is_active
+                    else "item",
+                    id=f"item-{i}",
+                )
+                for i, text in enumerate(rows[len(widgets) :], start=len(widgets))
+            ]
+            texts.extend(rows[len(widgets) :])
+            widgets.extend(added)
+            await container.mount_all(added)
+
+        if scroll_to_selection:
+            self._scroll_selection_to_top()
+        else:
+            container.scroll_home(animate=False)
+        self._update_empty_state()
+
+    async def _rebuild_items_and_scroll(self) -> None:
+        """Rebuild items and scroll selection to top."""
+        await self._rebuild_items(scroll_to_selection=True)
+
+    def _refresh_rows(self, *indices: int) -> None:
+        """Re-render the given rows in place."""
+        count = min(len(self._item_widgets), self._item_count())
+        for i in indices:
+            if 0 <= i < count:
+                item_widget = self._item_widgets[i]
+                text = self._render_row(i)
+                item_widget.update(text)
+                self._row_texts[i] = text
+                is_selected = i == self.selected_index and self.is_active
+                item_widget.set_class(is_selected, "item-selected")
+
+    def _scroll_to_selection(self) -> None:
+        """Scroll to keep the selected item visible."""
+        if self._item_count() == 0:
+            return
+        if self.selected_index < len(self._item_widgets):
+            item_widget = self._item_widgets[self.selected_index]
+            # Rows queued by _rebuild_items have no screen to scroll yet.
+            if item_widget.is_mounted:
+                item_widget.scroll_visible(animate=False)
+
+    def _scroll_selection_to_top(self) -> None:
+        """Scroll so the selected item is at the top of the container."""
+        if not self.is_mounted:
+            return
+        self._items_container.scroll_to(y=self.selected_index, animate=False)
+
+    def on_focus(self) -> None:
+        """Handle focus event."""
+        self.is_active = True
+        # Focus only changes the selected row's marker.
+        self._refresh_rows(self.selected_index)
+        self._emit_selection_message()
+
+    def on_blur(self) -> None:
+        """Handle blur event."""
+        self.is_active = False
+        if self._selection_timer is not None:
+            self._selection_timer.stop()
+            self._selection_timer = None
+            # A panel taking focus announces its own selection; anywhere else
+            # (e.g. the main pane) should still show where this cursor stopped.
+            if not isinstance(self.screen.focused, PanelRowsMixin):
+                self._emit_selection_message()
+        self._refresh_rows(self.selected_index)
+
+    def reemit_selection(self) -> None:
+        """Announce the current selection again, e.g. after a main pane reset."""
+        self._emit_selection_message()
@@ -3,13 +3,12 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
-from textual.app import ComposeResult
 from textual.binding import Binding
-from textual.containers import VerticalScroll
 from textual.dom import DOMNode
 from textual.events import Click
 from textual.message import Message
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Static
 
@@ -22,12 +21,25 @@ from lazyclaude.models.customization import (
     MemoryFileRef,
     SkillFile,
 )
-from lazyclaude.widgets.helpers import build_memory_flat_items, render_memory_item
+from lazyclaude.widgets.helpers import (
+    PanelRowsMixin,
+    build_memory_flat_items,
+    render_memory_item,
+)
 
 
-class TypePanel(Widget):
+class TypePanel(PanelRowsMixin, Widget):
     """Panel displaying customizations of a single type."""
 
+    TYPE_LABELS = {
+        CustomizationType.SLASH_COMMAND: "Slash Commands",
+        CustomizationType.SUBAGENT: "Subagents",
+        CustomizationType.SKILL: "Skills",
+        CustomizationType.MEMORY_FILE: "Memory Files",
+        CustomizationType.MCP: "MCPs",
+        CustomizationType.HOOK: "Hooks",
+    }
+
     BINDINGS = [
         Binding("tab", "focus_next_panel", "Next Panel", show=False),
         Binding("shift+tab", "focus_previous_panel", "Prev Panel", show=False),
@@ -144,6 +156,9 @@ class TypePanel(Widget):
         self._memory_flat_items: list[
             tuple[Customization, MemoryFileRef | None, int]
         ] = []
+        self._item_widgets: list[Static] = []
+        self._row_texts: list[str] = []
+        self._selection_timer: Timer | None = None
 
     @property
     def _is_skills_panel(self) -> bool:
@@ -158,14 +173,7 @@ class TypePanel(Widget):
     @property
     def type_label(self) -> str:
         """Get human-readable type label."""
-        return {
-            CustomizationType.SLASH_COMMAND: "Slash Commands",
-            CustomizationType.SUBAGENT: "Subagents",
-            CustomizationType.SKILL: "Skills",
-            CustomizationType.MEMORY_FILE: "Memory Files",
-            CustomizationType.MCP: "MCPs",
-            CustomizationType.HOOK: "Hooks",
-        }[self.customization_type]
+        return self.TYPE_LABELS[self.customization_type]
 
     @property
     def selected_customization(self) -> Customization | None:
@@ -174,44 +182,23 @@ class TypePanel(Widget):
             return self.customizations[self.selected_index]
         return None
 
-    def compose(self) -> ComposeResult:
-        """Compose the panel content."""
-        with VerticalScroll(classes="items-container"):
-            if self._is_skills_panel:
-                if not self._flat_items:
-                    yield Static("[dim italic]No items[/]", classes="empty-message")
-                else:
-                    for i, (skill, file_path) in enumerate(self._flat_items):
-                        yield Static(
-                            self._render_skill_item(i, skill, file_path),
-                            classes="item",
-                            id=f"item-{i}",
-                        )
-            elif self._is_memory_panel:
-                if not self._memory_flat_items:
-                    yield Static("[dim italic]No items[/]", classes="empty-message")
-                else:
-                    for i, (memory, ref, depth) in enumerate(self._memory_flat_items):
-                        yield Static(
-                            render_memory_item(
-                                i,
-                                memory,
-                                ref,
-                                depth,
-                                selected_index=self.selected_index,
-                                is_active=self.is_active,
-                                expanded_keys=self.expanded_memory_files,
-                            ),
-                            classes="item",
-                            id=f"item-{i}",
-                        )
-            elif not self.customizations:
-                yield Static("[dim italic]No items[/]", classes="empty-message")
-            else:
-                for i, item in enumerate(self.customizations):
-                    yield Static(
-                        self._render_item(i, item), classes="item", id=f"item-{i}"
-                    )
+    def _render_row(self, index: int) -> str:
+        """Render the row at index for the panel's current mode."""
+        if self._is_skills_panel:
+            skill, file_path = self._flat_items[index]
+            return self._render_skill_item(index, skill, file_path)
+        if self._is_memory_panel:
+            memory, ref, depth = self._memory_flat_items[index]
+            return render_memory_item(
+                index,
+                memory,
+                ref,
+                depth,
+                selected_index=self.selected_index,
+                is_active=self.is_active,
+                expanded_keys=self.expanded_memory_files,
+            )
+        return self._render_item(index, self.customizations[index])
 
     def _render_header(self) -> str:
         """Render the panel header with type label."""
@@ -277,81 +264,6 @@ class TypePanel(Widget):
             if self.is_active:
                 self._emit_selection_message()
 
-    def watch_selected_index(self, index: int) -> None:  # noqa: ARG002
-        """React to selected index changes."""
-        if self.is_mounted:
-            self.border_subtitle = self._render_footer()
-        self._refresh_display()
-        self._scroll_to_selection()
-        self._emit_selection_message()
-
-    async def _rebuild_items(self, *, scroll_to_selection: bool = False) -> None:
-        """Rebuild item widgets when customizations change."""
-        if not self.is_mounted:
-            return
-        container = self.query_one(".items-container", VerticalScroll)
-        await container.remove_children()
-
-        if self._is_skills_panel:
-            if not self._flat_items:
-                await container.mount(
-                    Static("[dim italic]No items[/]", classes="empty-message")
-                )
-            else:
-                for i, (skill, file_path) in enumerate(self._flat_items):
-                    is_selected = i == self.selected_index and self.is_active
-                    classes = "item item-selected" if is_selected else "item"
-                    await container.mount(
-                        Static(
-                            self._render_skill_item(i, skill, file_path),
-                            classes=classes,
-                            id=f"item-{i}",
-                        )
-                    )
-        elif self._is_memory_panel:
-            if not self._memory_flat_items:
-                await container.mount(
-                    Static("[dim italic]No items[/]", classes="empty-message")
-                )
-            else:
-                for i, (memory, ref, depth) in enumerate(self._memory_flat_items):
-                    is_selected = i == self.selected_index and self.is_active
-                    classes = "item item-selected" if is_selected else "item"
-                    await container.mount(
-                        Static(
-                            render_memory_item(
-                                i,
-                                memory,
-                                ref,
-                                depth,
-                                selected_index=self.selected_index,
-                                is_active=self.is_active,
-                                expanded_keys=self.expanded_memory_files,
-                            ),
-                            classes=classes,
-                            id=f"item-{i}",
-                        )
-                    )
-        else:
-            if not self.customizations:
-                await container.mount(
-                    Static("[dim italic]No items[/]", classes="empty-message")
-                )
-            else:
-                for i, item in enumerate(self.customizations):
-                    is_selected = i == self.selected_index and self.is_active
-                    classes = "item item-selected" if is_selected else "item"
-                    await container.mount(
-                        Static(
-                            self._render_item(i, item), classes=classes, id=f"item-{i}"
-                        )
-                    )
-
-        if scroll_to_selection:
-            self._scroll_selection_to_top()
-        else:
-            container.scroll_home(animate=False)
-
     def on_mount(self) -> None:
         """Handle mount event - rebuild items if customizations were set before mount."""
         self.border_title = self._render_header()
@@ -359,67 +271,6 @@ class TypePanel(Widget):
         if self.customizations:
             self.call_later(self._rebuild_items)
 
-    def _refresh_display(self) -> None:
-        """Refresh the panel display (updates existing widgets)."""
-        try:
-            items = list(self.query("Static.item"))
-            if self._is_skills_panel:
-                for i, (item_widget, (skill, file_path)) in enumerate(
-                    zip(items, self._flat_items, strict=False)
-                ):
-                    if isinstance(item_widget, Static):
-                        item_widget.update(self._render_skill_item(i, skill, file_path))
-                    is_selected = i == self.selected_index and self.is_active
-                    item_widget.set_class(is_selected, "item-selected")
-            elif self._is_memory_panel:
-                for i, (item_widget, (memory, ref, depth)) in enumerate(
-                    zip(items, self._memory_flat_items, strict=False)
-                ):
-                    if isinstance(item_widget, Static):
-                        item_widget.update(
-                            render_memory_item(
-                                i,
-                                memory,
-                                ref,
-                                depth,
-                                selected_index=self.selected_index,
-                                is_active=self.is_active,
-                                expanded_keys=self.expanded_memory_files,
-                            )
-                        )
-                    is_selected = i == self.selected_index and self.is_active
-                    item_widget.set_class(is_selected, "item-selected")
-            else:
-                for i, (item_widget, item) in enumerate(
-                    zip(items, self.customizations, strict=False)
-                ):
-                    if isinstance(item_widget, Static):
-                        item_widget.update(self._render_item(i, item))
-                    is_selected = i == self.selected_index and self.is_active
-                    item_widget.set_class(is_selected, "item-selected")
-        except Exception:
-            pass
-
-    def _scroll_to_selection(self) -> None:
-        """Scroll to keep the selected item visible."""
-        item_count = self._item_count()
-        if item_count == 0:
-            return
-        try:
-            items = list(self.query(".item"))
-            if 0 <= self.selected_index < len(items):
-                items[self.selected_index].scroll_visible(animate=False)
-        except Exception:
-            pass
-
-    def _scroll_selection_to_top(self) -> None:
-        """Scroll so the selected item is at the top of the container."""
-        try:
-            container = self.query_one(".items-container", VerticalScroll)
-            container.scroll_to(y=self.selected_index, animate=False)
-        except Exception:
-            pass
-
     def on_click(self, event: Click) -> None:
         """Handle click - select clicked item and focus panel."""
         self.focus()
@@ -446,17 +297,6 @@ class TypePanel(Widget):
                 break
             current = current.parent
 
-    def on_focus(self) -> None:
-        """Handle focus event."""
-        self.is_active = True
-        self._refresh_display()
-        self._emit_selection_message()
-
-    def on_blur(self) -> None:
-        """Handle blur event."""
-        self.is_active = False
-        self._refresh_display()
-
     def _item_count(self) -> int:
         """Get the number of items in the panel."""
         if self._is_skills_panel:
@@ -522,9 +362,8 @@ class TypePanel(Widget):
         await cast("LazyClaude", self.app).action_back()
 
     def set_customizations(self, customizations: list[Customization]) -> None:
-        """Set the customizations for this panel (filtered by type)."""
-        filtered = [c for c in customizations if c.type == self.customization_type]
-        self.customizations = filtered
+        """Set the customizations for this panel (already narrowed to its type)."""
+        self.customizations = customizations
         if self._is_skills_panel:
             self._rebuild_flat_items()
         elif self._is_memory_panel:
@@ -588,10 +427,6 @@ class TypePanel(Widget):
         except ValueError:
             return 1
 
-    async def _rebuild_items_and_scroll(self) -> None:
-        """Rebuild items and scroll selection to top."""
-        await self._rebuild_items(scroll_to_selection=True)
-
     def action_expand(self) -> None:
         """Expand the currently selected item."""
         if self._is_skills_panel and self._flat_items:
@@ -1,9 +1,7 @@
 """Shared pytest fixtures for LazyClaude tests."""
 
 import os
-from collections.abc import Generator
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 from pyfakefs.fake_filesystem import FakeFilesystem
@@ -12,6 +10,33 @@ FIXTURES_DIR = Path(__file__).parent / "integration" / "fixtures"
 FAKE_HOME = Path("/fake/home")
 
 
+def _read_fixture_files(root: Path) -> dict[Path, bytes]:
+    """Read every fixture file, keyed by its path relative to root."""
+    return {
+        path.relative_to(root): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+# Read once at import, before pyfakefs patches the filesystem. Fake files
+# created from these bytes are complete immediately, so threaded discovery
+# never sees a half-loaded real file.
+_FIXTURE_FILES = _read_fixture_files(FIXTURES_DIR)
+
+
+def _add_fixture(fs: FakeFilesystem, source: Path, target: Path) -> None:
+    """Copy a fixture file or directory into the fake filesystem."""
+    relative = source.relative_to(FIXTURES_DIR)
+    contents = _FIXTURE_FILES.get(relative)
+    if contents is not None:
+        fs.create_file(target, contents=contents)
+        return
+    for path, contents in _FIXTURE_FILES.items():
+        if path.is_relative_to(relative):
+            fs.create_file(target / path.relative_to(relative), contents=contents)
+
+
 @pytest.fixture
 def _fs(fs: FakeFilesystem) -> FakeFilesystem:
     """Alias for fs fixture when pyfakefs is needed but not explicitly used."""
@@ -19,14 +44,13 @@ def _fs(fs: FakeFilesystem) -> FakeFilesystem:
 
 
 @pytest.fixture
-def fake_home(fs: FakeFilesystem) -> Generator[Path, None, None]:
+def fake_home(fs: FakeFilesystem, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Create a fake home directory and patch Path.home() to return it."""
     fs.create_dir(FAKE_HOME)
-    os.environ["HOME"] = str(FAKE_HOME)
-    os.environ["USERPROFILE"] = str(FAKE_HOME)
-
-    with patch.object(Path, "home", return_value=FAKE_HOME):
-        yield FAKE_HOME
+    # expanduser() reads USERPROFILE on Windows and HOME elsewhere.
+    monkeypatch.setenv("USERPROFILE" if os.name == "nt" else "HOME", str(FAKE_HOME))
+    monkeypatch.setattr(Path, "home", lambda: FAKE_HOME)
+    return FAKE_HOME
 
 
 @pytest.fixture
@@ -43,40 +67,23 @@ def user_config_path(fake_home: Path, fs: FakeFilesystem) -> Path:
     user_claude = fake_home / ".claude"
     fs.create_dir(user_claude)
 
-    fs.add_real_directory(
-        FIXTURES_DIR / "commands",
-        target_path=user_claude / "commands",
-        read_only=False,
-    )
-    fs.add_real_directory(
-        FIXTURES_DIR / "agents",
-        target_path=user_claude / "agents",
-        read_only=False,
-    )
-    fs.add_real_directory(
-        FIXTURES_DIR / "skills",
-        target_path=user_claude / "skills",
-        read_only=False,
-    )
+    _add_fixture(fs, FIXTURES_DIR / "commands", user_claude / "commands")
+    _add_fixture(fs, FIXTURES_DIR / "agents", user_claude / "agents")
+    _add_fixture(fs, FIXTURES_DIR / "skills", user_claude / "skills")
 
     user_memory_dir = user_claude
-    fs.add_real_file(
-        FIXTURES_DIR / "memory" / "CLAUDE.md",
-        target_path=user_memory_dir / "CLAUDE.md",
-        read_only=False,
+    _add_fixture(
+        fs, FIXTURES_DIR / "memory" / "CLAUDE.md", user_memory_dir / "CLAUDE.md"
     )
-    fs.add_real_file(
-        FIXTURES_DIR / "memory" / "AGENTS.md",
-        target_path=user_memory_dir / "AGENTS.md",
-        read_only=False,
+    _add_fixture(
+        fs, FIXTURES_DIR / "memory" / "AGENTS.md", user_memory_dir / "AGENTS.md"
     )
 
-    fs.add_real_file(
+    _add_fixture(
+        fs,
         FIXTURES_DIR / "settings" / "user-settings.json",
-        target_path=user_claude / "settings.json",
-        read_only=False,
+        user_claude / "settings.json",
     )
-
     return user_claude
 
 
@@ -84,11 +91,7 @@ def user_config_path(fake_home: Path, fs: FakeFilesystem) -> Path:
 def user_mcp_config(fake_home: Path, fs: FakeFilesystem) -> Path:
     """Create user-level MCP config (~/.claude.json)."""
     mcp_path = fake_home / ".claude.json"
-    fs.add_real_file(
-        FIXTURES_DIR / "mcp" / "user.claude.json",
-        target_path=mcp_path,
-        read_only=False,
-    )
+    _add_fixture(fs, FIXTURES_DIR / "mcp" / "user.claude.json", mcp_path)
     return mcp_path
 
 
@@ -96,11 +99,7 @@ def user_mcp_config(fake_home: Path, fs: FakeFilesystem) -> Path:
 def project_mcp_config(fake_project_root: Path, fs: FakeFilesystem) -> Path:
     """Create project-level MCP config (.mcp.json)."""
     mcp_path = fake_project_root / ".mcp.json"
-    fs.add_real_file(
-        FIXTURES_DIR / "mcp" / "project.mcp.json",
-        target_path=mcp_path,
-        read_only=False,
-    )
+    _add_fixture(fs, FIXTURES_DIR / "mcp" / "project.mcp.json", mcp_path)
     return mcp_path
 
 
@@ -108,11 +107,7 @@ def project_mcp_config(fake_project_root: Path, fs: FakeFilesystem) -> Path:
 def local_mcp_config(fake_home: Path, fs: FakeFilesystem) -> Path:
     """Create local-level MCP config (~/.claude.json with projects section)."""
     mcp_path = fake_home / ".claude.json"
-    fs.add_real_file(
-        FIXTURES_DIR / "mcp" / "local.claude.json",
-        target_path=mcp_path,
-        read_only=False,
-    )
+    _add_fixture(fs, FIXTURES_DIR / "mcp" / "local.claude.json", mcp_path)
     return mcp_path
 
 
@@ -122,32 +117,17 @@ def project_config_path(fake_project_root: Path, fs: FakeFilesystem) -> Path:
     project_claude = fake_project_root / ".claude"
     fs.create_dir(project_claude)
 
-    fs.add_real_directory(
-        FIXTURES_DIR / "project" / "commands",
-        target_path=project_claude / "commands",
-        read_only=False,
-    )
-    fs.add_real_directory(
-        FIXTURES_DIR / "project" / "agents",
-        target_path=project_claude / "agents",
-        read_only=False,
+    _add_fixture(fs, FIXTURES_DIR / "project" / "commands", project_claude / "commands")
+    _add_fixture(fs, FIXTURES_DIR / "project" / "agents", project_claude / "agents")
+    _add_fixture(fs, FIXTURES_DIR / "project" / "skills", project_claude / "skills")
+    _add_fixture(
+        fs, FIXTURES_DIR / "project" / "CLAUDE.md", project_claude / "CLAUDE.md"
     )
-    fs.add_real_directory(
-        FIXTURES_DIR / "project" / "skills",
-        target_path=project_claude / "skills",
-        read_only=False,
-    )
-    fs.add_real_file(
-        FIXTURES_DIR / "project" / "CLAUDE.md",
-        target_path=project_claude / "CLAUDE.md",
-        read_only=False,
-    )
-    fs.add_real_file(
+    _add_fixture(
+        fs,
         FIXTURES_DIR / "settings" / "project-settings.json",
-        target_path=project_claude / "settings.json",
-        read_only=False,
+        project_claude / "settings.json",
     )
-
     return project_claude
 
 
@@ -157,22 +137,21 @@ def plugins_config(user_config_path: Path, fs: FakeFilesystem) -> Path:
     plugins_dir = user_config_path / "plugins"
     fs.create_dir(plugins_dir)
 
-    fs.add_real_file(
+    _add_fixture(
+        fs,
         FIXTURES_DIR / "plugins" / "installed_plugins.json",
-        target_path=plugins_dir / "installed_plugins.json",
-        read_only=False,
+        plugins_dir / "installed_plugins.json",
     )
 
     # V2 uses cache directory with versioned paths
     cache_dir = plugins_dir / "cache" / "test"
     fs.create_dir(cache_dir)
 
-    fs.add_real_directory(
+    _add_fixture(
+        fs,
         FIXTURES_DIR / "plugins" / "example-plugin",
-        target_path=cache_dir / "example-plugin" / "1.0.0",
-        read_only=False,
+        cache_dir / "example-plugin" / "1.0.0",
     )
-
     return plugins_dir
 
 
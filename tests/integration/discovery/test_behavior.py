@@ -224,3 +224,24 @@ class TestPathResolution:
         active_path = service.get_active_config_path()
 
         assert active_path == user_config_path
+
+    def test_active_path_recomputed_after_refresh(
+        self,
+        user_config_path: Path,
+        fake_project_root: Path,
+        fs: FakeFilesystem,
+    ) -> None:
+        """A project config created after startup becomes active on refresh."""
+        project_claude = fake_project_root / ".claude"
+        service = ConfigDiscoveryService(
+            user_config_path=user_config_path,
+            project_config_path=project_claude,
+        )
+
+        assert service.get_active_config_path() == user_config_path
+
+        fs.create_dir(project_claude)
+        assert service.get_active_config_path() == user_config_path
+
+        service.refresh()
+        assert service.get_active_config_path() == project_claude.resolve()
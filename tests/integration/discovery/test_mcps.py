@@ -2,6 +2,7 @@
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 from pyfakefs.fake_filesystem import FakeFilesystem
 
@@ -215,3 +216,60 @@ class TestLocalMCPDiscovery:
         local_mcps = [m for m in mcps if m.level == ConfigLevel.PROJECT_LOCAL]
         assert len(local_mcps) == 1
         assert local_mcps[0].name == "backslash-server"
+
+    def test_claude_json_parsed_once_per_change(
+        self,
+        user_config_path: Path,
+        fake_home: Path,
+        fake_project_root: Path,
+        fs: FakeFilesystem,
+    ) -> None:
+        """~/.claude.json is parsed once for user and local MCPs until it changes."""
+        claude_json = fake_home / ".claude.json"
+        content = {
+            "mcpServers": {"user-server": {"command": "npx"}},
+            "projects": {
+                str(fake_project_root.resolve()): {
+                    "mcpServers": {"local-server": {"command": "uvx"}}
+                }
+            },
+        }
+        fs.create_file(claude_json, contents=json.dumps(content))
+
+        service = ConfigDiscoveryService(
+            user_config_path=user_config_path,
+            project_config_path=fake_project_root / ".claude",
+        )
+
+        with patch(
+            "lazyclaude.services.json_cache.json.loads", wraps=json.loads
+        ) as loads:
+            names = {m.name for m in service.discover_by_type(CustomizationType.MCP)}
+            service.refresh()
+
+        assert names == {"user-server", "local-server"}
+        claude_json_loads = [
+            c for c in loads.call_args_list if "local-server" in str(c.args[0])
+        ]
+        assert len(claude_json_loads) == 1
+
+    def test_non_utf8_mcp_config_reports_error(
+        self,
+        user_config_path: Path,
+        project_config_path: Path,
+        fake_project_root: Path,
+        fs: FakeFilesystem,
+    ) -> None:
+        """A .mcp.json that is not valid UTF-8 surfaces as a parse error."""
+        fs.create_file(fake_project_root / ".mcp.json", contents=b'{"\xff": 1}')
+
+        service = ConfigDiscoveryService(
+            user_config_path=user_config_path,
+            project_config_path=project_config_path,
+        )
+
+        mcps = service.discover_by_type(CustomizationType.MCP)
+
+        project_mcps = [m for m in mcps if m.level == ConfigLevel.PROJECT]
+        assert len(project_mcps) == 1
+        assert project_mcps[0].has_error
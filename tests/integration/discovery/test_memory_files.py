@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+from pyfakefs.fake_filesystem import FakeFilesystem
+
 from lazyclaude.models.customization import ConfigLevel, CustomizationType
 from lazyclaude.services.discovery import ConfigDiscoveryService
 
@@ -53,3 +55,23 @@ class TestMemoryFileDiscovery:
         assert len(project_memory) == 1
         assert project_memory[0].name == "CLAUDE.md"
         assert "Build Commands" in project_memory[0].content
+
+    def test_symlinked_project_memory_file_is_listed_once(
+        self,
+        user_config_path: Path,
+        project_config_path: Path,
+        fs: FakeFilesystem,
+    ) -> None:
+        """A memory file reachable through a symlink is listed only once."""
+        fs.create_symlink(
+            project_config_path.parent / "CLAUDE.md", project_config_path / "CLAUDE.md"
+        )
+        service = ConfigDiscoveryService(
+            user_config_path=user_config_path,
+            project_config_path=project_config_path,
+        )
+
+        memory_files = service.discover_by_type(CustomizationType.MEMORY_FILE)
+
+        project_memory = [m for m in memory_files if m.level == ConfigLevel.PROJECT]
+        assert len(project_memory) == 1
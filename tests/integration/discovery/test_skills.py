@@ -90,6 +90,24 @@ class TestSkillFileDiscovery:
         assert reference_file.content is not None
         assert "API documentation" in reference_file.content
 
+    def test_skill_file_content_read_on_first_access(
+        self, user_config_path: Path, fake_project_root: Path
+    ) -> None:
+        """Verify file content is deferred until first accessed."""
+        service = ConfigDiscoveryService(
+            user_config_path=user_config_path,
+            project_config_path=fake_project_root / ".claude",
+        )
+
+        skills = service.discover_by_type(CustomizationType.SKILL)
+        full_skill = next(s for s in skills if s.name == "full-skill")
+        files: list[SkillFile] = full_skill.metadata.get("files", [])
+        examples_file = next(f for f in files if f.name == "examples.md")
+
+        examples_file.path.write_text("Updated examples", encoding="utf-8")
+
+        assert examples_file.content == "Updated examples"
+
     def test_skill_nested_directories_discovered(
         self, user_config_path: Path, fake_project_root: Path
     ) -> None:
@@ -139,6 +157,27 @@ class TestSkillFileDiscovery:
 
         assert full_skill.metadata.get("has_scripts") is True
 
+    def test_skill_dangling_reference_link_not_flagged(
+        self, fs, user_config_path: Path, fake_project_root: Path
+    ) -> None:
+        """Verify a reference.md symlink to a missing file doesn't set has_reference."""
+        skill_dir = user_config_path / "skills" / "dangling"
+        fs.create_file(
+            skill_dir / "SKILL.md",
+            contents="---\nname: dangling\ndescription: Broken link\n---\nContent",
+        )
+        fs.create_symlink(skill_dir / "reference.md", skill_dir / "missing.md")
+
+        service = ConfigDiscoveryService(
+            user_config_path=user_config_path,
+            project_config_path=fake_project_root / ".claude",
+        )
+
+        skills = service.discover_by_type(CustomizationType.SKILL)
+        dangling = next(s for s in skills if s.name == "dangling")
+
+        assert dangling.metadata.get("has_reference") is False
+
     def test_skill_tags_parsed(
         self, user_config_path: Path, fake_project_root: Path
     ) -> None:
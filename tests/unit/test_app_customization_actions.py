@@ -1,5 +1,7 @@
 """Tests for app-level customization action constants and helpers."""
 
+from pathlib import Path
+
 import pytest
 
 from lazyclaude.app import LazyClaude
@@ -164,3 +166,27 @@ class TestGetAvailableTargetLevels:
         assert ConfigLevel.USER in levels
         assert ConfigLevel.PROJECT not in levels
         assert ConfigLevel.PROJECT_LOCAL not in levels
+
+
+class TestLaunchEditor:
+    """Tests for $EDITOR handling in _launch_editor."""
+
+    def test_malformed_editor_only_fails_the_launch(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An unparsable $EDITOR is reported when editing, not at startup."""
+        monkeypatch.setenv("EDITOR", "'unbalanced")
+        app = LazyClaude()
+        notices: list[tuple[str, str]] = []
+        monkeypatch.setattr(
+            app, "notify", lambda message, severity: notices.append((message, severity))
+        )
+        monkeypatch.setattr(
+            "subprocess.Popen", lambda *_args, **_kwargs: pytest.fail("editor ran")
+        )
+
+        app._launch_editor([Path("/fake/file.md")])
+
+        assert len(notices) == 1
+        assert notices[0][1] == "error"
+        assert "$EDITOR" in notices[0][0]
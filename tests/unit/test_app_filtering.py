@@ -0,0 +1,78 @@
+"""Tests for app-level filtering helpers."""
+
+from pathlib import Path
+
+import pytest
+
+from lazyclaude.app import LazyClaude
+from lazyclaude.models.customization import (
+    ConfigLevel,
+    Customization,
+    CustomizationType,
+)
+
+
+def _create_customization(
+    name: str,
+    level: ConfigLevel = ConfigLevel.USER,
+    ctype: CustomizationType = CustomizationType.SLASH_COMMAND,
+) -> Customization:
+    """Create a test customization."""
+    return Customization(
+        name=name,
+        type=ctype,
+        level=level,
+        path=Path(f"/fake/{name}.md"),
+    )
+
+
+class TestFilteredCustomizationsCache:
+    """Tests for memoization of filtered customization lists."""
+
+    @pytest.fixture
+    def app(self) -> LazyClaude:
+        """Create app instance with a fixed customization list."""
+        app = LazyClaude()
+        app._customizations = [
+            _create_customization("alpha", ConfigLevel.USER),
+            _create_customization("beta", ConfigLevel.PROJECT),
+        ]
+        app._reindex_customizations()
+        return app
+
+    def test_repeated_filter_returns_cached_list(self, app: LazyClaude) -> None:
+        """Same filter state returns the same list object."""
+        app._level_filter = ConfigLevel.USER
+
+        first = app._get_filtered_customizations()
+        second = app._get_filtered_customizations()
+
+        assert first is second
+        assert [c.name for c in first] == ["alpha"]
+
+    def test_different_filter_state_is_cached_separately(self, app: LazyClaude) -> None:
+        """Changing the level filter produces a different result."""
+        app._level_filter = ConfigLevel.USER
+        user_items = app._get_filtered_customizations()
+        app._level_filter = ConfigLevel.PROJECT
+        project_items = app._get_filtered_customizations()
+
+        assert [c.name for c in user_items] == ["alpha"]
+        assert [c.name for c in project_items] == ["beta"]
+
+    def test_cache_size_is_bounded(self, app: LazyClaude) -> None:
+        """Oldest entries are evicted once the cache is full."""
+        for i in range(LazyClaude._FILTER_CACHE_SIZE + 5):
+            app._search_query = f"query-{i}"
+            app._get_filtered_customizations()
+
+        assert len(app._filter_cache) == LazyClaude._FILTER_CACHE_SIZE
+        assert ("query-0", None, True) not in app._filter_cache
+
+    def test_reindex_clears_cache(self, app: LazyClaude) -> None:
+        """Reindexing after a reload drops memoized results."""
+        app._get_filtered_customizations()
+        app._customizations = [_create_customization("gamma", ConfigLevel.USER)]
+        app._reindex_customizations()
+
+        assert [c.name for c in app._get_filtered_customizations()] == ["gamma"]
@@ -0,0 +1,22 @@
+"""Tests for AppFooter widget."""
+
+from lazyclaude.widgets.app_footer import AppFooter
+
+
+class TestFooterTextCache:
+    """Tests for memoization of rendered footer text."""
+
+    def test_same_state_reuses_text(self) -> None:
+        """Footers in the same state share the rendered string."""
+        assert AppFooter()._get_footer_text() is AppFooter()._get_footer_text()
+
+    def test_state_change_renders_new_text(self) -> None:
+        """Changing a reactive yields text for the new state."""
+        footer = AppFooter()
+        before = footer._get_footer_text()
+        footer.can_delete = True
+
+        after = footer._get_footer_text()
+
+        assert after != before
+        assert after == footer._render_footer_text()
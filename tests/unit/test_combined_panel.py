@@ -2,7 +2,11 @@
 
 import pytest
 
-from lazyclaude.models.customization import CustomizationType
+from lazyclaude.models.customization import (
+    ConfigLevel,
+    Customization,
+    CustomizationType,
+)
 from lazyclaude.widgets.combined_panel import CombinedPanel
 
 
@@ -293,6 +297,33 @@ class TestCombinedPanelTabSwitching:
         assert panel.active_type == CustomizationType.MEMORY_FILE
 
 
+class TestCombinedPanelSetCustomizations:
+    """Tests for feeding items into the panel."""
+
+    def test_prebucketed_items_are_used_as_given(self) -> None:
+        """set_customizations should reuse the caller's per-type buckets."""
+        panel = CombinedPanel()
+        hooks = [
+            Customization(
+                name=f"hook{i}",
+                type=CustomizationType.HOOK,
+                path=f"/test/hook{i}",
+                level=ConfigLevel.USER,
+                content="test",
+            )
+            for i in range(2)
+        ]
+        by_type: dict[CustomizationType, list[Customization]] = {
+            ctype: [] for ctype in CustomizationType
+        }
+        by_type[CustomizationType.HOOK] = hooks
+
+        panel.set_customizations(list(hooks), by_type=by_type)
+        panel.switch_to_type(CustomizationType.HOOK)
+
+        assert panel._filtered_customizations is hooks
+
+
 class TestCombinedPanelMessages:
     """Tests for CombinedPanel message emission."""
 
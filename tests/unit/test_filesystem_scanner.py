@@ -1,13 +1,17 @@
 """Unit tests for FilesystemScanner with gitignore filtering."""
 
+import threading
 from pathlib import Path
 
+from lazyclaude.models.customization import ConfigLevel, Customization
 from lazyclaude.services.filesystem_scanner import (
     FilesystemScanner,
     GlobStrategy,
     ScanConfig,
+    scandir_files,
 )
 from lazyclaude.services.gitignore_filter import GitignoreFilter
+from lazyclaude.services.parsers.skill import SkillParser
 from lazyclaude.services.parsers.slash_command import SlashCommandParser
 
 
@@ -218,3 +222,150 @@ def test_subdir_strategy_filters_both_directories_and_files(tmp_path: Path) -> N
     assert len(results_md) == 1
     assert results_md[0].parent.name == "prod-feature"
     assert len(results_local) == 0
+
+
+def test_scan_directory_preserves_file_order_when_parsing_in_parallel(
+    tmp_path: Path,
+) -> None:
+    """Test that concurrent parsing returns results in discovery order."""
+    commands_dir = tmp_path / "commands"
+    commands_dir.mkdir()
+    names = [f"cmd{i:02d}" for i in range(20)]
+    for name in names:
+        (commands_dir / f"{name}.md").write_text(f"---\ndescription: {name}\n---\n")
+
+    scanner = FilesystemScanner()
+    config = ScanConfig(
+        subdir="commands",
+        pattern="*.md",
+        strategy=GlobStrategy.GLOB,
+        parser_factory=SlashCommandParser,
+    )
+
+    expected = [f.stem for f in scanner._get_files(commands_dir, config)]
+    results = scanner.scan_directory(tmp_path, config, ConfigLevel.USER)
+
+    assert [c.name for c in results] == expected
+    assert sorted(expected) == names
+
+
+def test_scan_directory_parses_inline_with_single_worker(tmp_path: Path) -> None:
+    """Test that parse_workers=1 parses on the calling thread."""
+    commands_dir = tmp_path / "commands"
+    commands_dir.mkdir()
+    for i in range(4):
+        (commands_dir / f"cmd{i}.md").write_text("---\ndescription: cmd\n---\n")
+
+    threads: set[int] = set()
+
+    class ThreadRecordingParser(SlashCommandParser):
+        def parse(self, path: Path, level: ConfigLevel) -> Customization:
+            threads.add(threading.get_ident())
+            return super().parse(path, level)
+
+    scanner = FilesystemScanner(parse_workers=1)
+    config = ScanConfig(
+        subdir="commands",
+        pattern="*.md",
+        strategy=GlobStrategy.GLOB,
+        parser_factory=ThreadRecordingParser,
+    )
+
+    assert len(scanner.scan_directory(tmp_path, config, ConfigLevel.USER)) == 4
+    assert threads == {threading.get_ident()}
+
+
+def test_scan_directory_reuses_parse_results_for_unchanged_files(
+    tmp_path: Path,
+) -> None:
+    """Test that rescanning only re-parses files whose stat signature changed."""
+    commands_dir = tmp_path / "commands"
+    commands_dir.mkdir()
+    (commands_dir / "stable.md").write_text("---\ndescription: stable\n---\n")
+    edited = commands_dir / "edited.md"
+    edited.write_text("---\ndescription: before\n---\n")
+
+    parsed: list[str] = []
+
+    class CountingParser(SlashCommandParser):
+        def parse(self, path: Path, level: ConfigLevel) -> Customization:
+            parsed.append(path.name)
+            return super().parse(path, level)
+
+    scanner = FilesystemScanner()
+    config = ScanConfig(
+        subdir="commands",
+        pattern="*.md",
+        strategy=GlobStrategy.GLOB,
+        parser_factory=CountingParser,
+    )
+
+    first = scanner.scan_directory(tmp_path, config, ConfigLevel.USER)
+    edited.write_text("---\ndescription: after the edit\n---\n")
+    parsed.clear()
+    second = scanner.scan_directory(tmp_path, config, ConfigLevel.USER)
+
+    assert parsed == ["edited.md"]
+    assert {c.description for c in second} == {"stable", "after the edit"}
+    assert not {id(c) for c in first} & {id(c) for c in second}
+
+
+def test_scan_directory_picks_up_files_added_deep_in_a_skill_tree(
+    tmp_path: Path,
+) -> None:
+    """Test that rescanning skills lists files added below their subdirectories."""
+    scripts = tmp_path / "skills" / "tool" / "scripts"
+    scripts.mkdir(parents=True)
+    (scripts.parent / "SKILL.md").write_text("---\nname: tool\n---\n")
+    (scripts / "a.py").write_text("a")
+
+    scanner = FilesystemScanner()
+    config = ScanConfig(
+        subdir="skills",
+        pattern="SKILL.md",
+        strategy=GlobStrategy.SUBDIR,
+        parser_factory=SkillParser,
+        cache_parses=False,
+    )
+
+    scanner.scan_directory(tmp_path, config, ConfigLevel.USER)
+    (scripts / "b.py").write_text("b")
+    (skill,) = scanner.scan_directory(tmp_path, config, ConfigLevel.USER)
+
+    (scripts_entry,) = skill.metadata["files"]
+    assert [f.name for f in scripts_entry.children] == ["a.py", "b.py"]
+
+
+def test_scandir_files_matches_like_glob_and_rglob(tmp_path: Path) -> None:
+    """Test that scandir_files mirrors glob/rglob matching and symlink handling."""
+    (tmp_path / "top.md").write_text("top")
+    (tmp_path / "notes.txt").write_text("notes")
+    (tmp_path / "folder.md").mkdir()
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    (nested / "deep.md").write_text("deep")
+    outside = tmp_path.parent / f"{tmp_path.name}-outside"
+    outside.mkdir()
+    (outside / "linked.md").write_text("linked")
+    (tmp_path / "link.md").symlink_to(outside / "linked.md")
+    (tmp_path / "linked-dir").symlink_to(outside, target_is_directory=True)
+
+    flat = {p.name for p in scandir_files(tmp_path, "*.md")}
+    recursive = {
+        p.relative_to(tmp_path).as_posix()
+        for p in scandir_files(tmp_path, "*.md", recursive=True)
+    }
+
+    assert flat == {"top.md", "link.md"}
+    assert recursive == {"top.md", "link.md", "nested/deep.md"}
+
+
+def test_scandir_files_literal_pattern_checks_single_path(tmp_path: Path) -> None:
+    """Test that a literal non-recursive pattern resolves to one file check."""
+    (tmp_path / "SKILL.md").write_text("skill")
+    (tmp_path / "OTHER.md").write_text("other")
+    (tmp_path / "dir").mkdir()
+
+    assert list(scandir_files(tmp_path, "SKILL.md")) == [tmp_path / "SKILL.md"]
+    assert list(scandir_files(tmp_path, "MISSING.md")) == []
+    assert list(scandir_files(tmp_path, "dir")) == []
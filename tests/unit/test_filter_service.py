@@ -0,0 +1,162 @@
+"""Tests for FilterService."""
+
+from pathlib import Path
+
+from lazyclaude.models.customization import (
+    ConfigLevel,
+    Customization,
+    CustomizationType,
+    PluginInfo,
+    PluginScope,
+)
+from lazyclaude.services.filter import FilterService
+
+
+def _create_customization(
+    name: str,
+    level: ConfigLevel = ConfigLevel.USER,
+    ctype: CustomizationType = CustomizationType.SLASH_COMMAND,
+    plugin_info: PluginInfo | None = None,
+) -> Customization:
+    """Create a test customization."""
+    return Customization(
+        name=name,
+        type=ctype,
+        level=level,
+        path=Path(f"/fake/{name}.md"),
+        plugin_info=plugin_info,
+    )
+
+
+def _create_plugin_info(scope: PluginScope = PluginScope.USER) -> PluginInfo:
+    """Create a test plugin info."""
+    return PluginInfo(
+        plugin_id="handbook@cc-handbook",
+        short_name="handbook",
+        version="1.0.0",
+        install_path=Path("/fake/plugins/handbook"),
+        scope=scope,
+    )
+
+
+class TestGroupByLevel:
+    """Tests for FilterService.group_by_level."""
+
+    def test_buckets_match_level_filter(self) -> None:
+        """Each bucket equals filtering the full list by that level."""
+        service = FilterService()
+        customizations = [
+            _create_customization("user-cmd", ConfigLevel.USER),
+            _create_customization("project-cmd", ConfigLevel.PROJECT),
+            _create_customization("local-mcp", ConfigLevel.PROJECT_LOCAL),
+            _create_customization(
+                "plugin-cmd",
+                ConfigLevel.PLUGIN,
+                plugin_info=_create_plugin_info(PluginScope.PROJECT),
+            ),
+        ]
+
+        buckets = service.group_by_level(customizations)
+
+        for level in ConfigLevel:
+            assert buckets[level] == service.filter(customizations, level=level)
+
+    def test_project_bucket_includes_local_and_project_plugins(self) -> None:
+        """Project bucket includes project-local items and project-scoped plugins."""
+        service = FilterService()
+        local = _create_customization("local-mcp", ConfigLevel.PROJECT_LOCAL)
+        plugin = _create_customization(
+            "plugin-cmd",
+            ConfigLevel.PLUGIN,
+            plugin_info=_create_plugin_info(PluginScope.PROJECT_LOCAL),
+        )
+
+        buckets = service.group_by_level([local, plugin])
+
+        assert buckets[ConfigLevel.PROJECT] == [local, plugin]
+        assert buckets[ConfigLevel.USER] == []
+
+    def test_empty_input_returns_empty_buckets(self) -> None:
+        """Every level has an empty bucket for an empty input."""
+        buckets = FilterService().group_by_level([])
+
+        assert set(buckets) == set(ConfigLevel)
+        assert all(bucket == [] for bucket in buckets.values())
+
+
+class TestQueryMatching:
+    """Tests for FilterService query matching."""
+
+    def test_matches_name_case_insensitively(self) -> None:
+        """Query matches a substring of the name regardless of case."""
+        service = FilterService()
+        customizations = [
+            _create_customization("Deploy-App"),
+            _create_customization("review"),
+        ]
+
+        result = service.filter(customizations, query="DEPLOY")
+
+        assert [c.name for c in result] == ["Deploy-App"]
+
+    def test_matches_plugin_prefix(self) -> None:
+        """Query matches the plugin short name prefix of plugin items."""
+        service = FilterService()
+        plugin_item = _create_customization(
+            "commit", ConfigLevel.PLUGIN, plugin_info=_create_plugin_info()
+        )
+        customizations = [plugin_item, _create_customization("other")]
+
+        assert service.filter(customizations, query="handbook") == [plugin_item]
+        assert service.filter(customizations, query="book:com") == [plugin_item]
+
+    def test_prefix_does_not_apply_to_non_plugin_items(self) -> None:
+        """Non-plugin items only match on their own name."""
+        service = FilterService()
+        customizations = [_create_customization("commit")]
+
+        assert service.filter(customizations, query=":commit") == []
+
+    def test_multiple_terms_must_all_match(self) -> None:
+        """Whitespace-separated terms are matched independently."""
+        service = FilterService()
+        customizations = [
+            _create_customization("deploy-staging"),
+            _create_customization("deploy-prod"),
+            _create_customization("staging-reset"),
+        ]
+
+        result = service.filter(customizations, query="staging deploy")
+
+        assert [c.name for c in result] == ["deploy-staging"]
+
+    def test_whitespace_only_query_matches_everything(self) -> None:
+        """A query with no terms does not filter."""
+        service = FilterService()
+        customizations = [_create_customization("a"), _create_customization("b")]
+
+        assert service.filter(customizations, query="   ") == customizations
+
+
+class TestCombinedFilters:
+    """Tests for FilterService.filter with several filters at once."""
+
+    def test_no_filters_returns_input_list(self) -> None:
+        """Without any active filter the input list is returned as-is."""
+        service = FilterService()
+        customizations = [_create_customization("a"), _create_customization("b")]
+
+        assert service.filter(customizations) is customizations
+
+    def test_level_and_query_both_apply(self) -> None:
+        """Level and query filters are combined with AND."""
+        service = FilterService()
+        customizations = [
+            _create_customization("deploy", ConfigLevel.USER),
+            _create_customization("deploy", ConfigLevel.PROJECT),
+            _create_customization("reset", ConfigLevel.PROJECT),
+        ]
+
+        result = service.filter(customizations, query="dep", level=ConfigLevel.PROJECT)
+
+        assert [(c.name, c.level) for c in result] == [("deploy", ConfigLevel.PROJECT)]
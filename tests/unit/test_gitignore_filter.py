@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+from lazyclaude.services.discovery import MEMORY_WALK_SKIP_DIRS
 from lazyclaude.services.gitignore_filter import (
     DEFAULT_SKIP_DIRS,
     GitignoreFilter,
@@ -198,3 +199,34 @@ def test_walk_filtered_prunes_nested_gitignored_directories(tmp_path: Path) -> N
     assert len(results) == 2
     assert results[0] == tmp_path / "lib" / "utils.md"
     assert results[1] == tmp_path / "src" / "main.md"
+
+
+def test_walk_filtered_prunes_build_output_directories(tmp_path: Path) -> None:
+    """Test walk_filtered skips build outputs and installed package trees."""
+    (tmp_path / "CLAUDE.md").write_text("root")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "CLAUDE.md").write_text("docs")
+    for heavy in ("target", "site-packages", ".ruff_cache", ".next"):
+        (tmp_path / heavy / "nested").mkdir(parents=True)
+        (tmp_path / heavy / "nested" / "CLAUDE.md").write_text("skip")
+    (tmp_path / "docs" / "NOTCLAUDE.md").write_text("other")
+
+    filter_service = GitignoreFilter(project_root=tmp_path)
+    results = sorted(
+        filter_service.walk_filtered(
+            tmp_path, "CLAUDE.md", extra_skip_dirs=MEMORY_WALK_SKIP_DIRS
+        )
+    )
+
+    assert results == [tmp_path / "CLAUDE.md", tmp_path / "docs" / "CLAUDE.md"]
+
+
+def test_walk_filtered_keeps_build_output_names_by_default(tmp_path: Path) -> None:
+    """Test walk_filtered only prunes the memory-walk extras when asked to."""
+    (tmp_path / "target").mkdir()
+    (tmp_path / "target" / "deploy.md").write_text("command")
+
+    filter_service = GitignoreFilter(project_root=tmp_path)
+    results = list(filter_service.walk_filtered(tmp_path, "*.md"))
+
+    assert results == [tmp_path / "target" / "deploy.md"]
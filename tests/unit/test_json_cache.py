@@ -0,0 +1,49 @@
+"""Tests for JsonFileCache."""
+
+import json
+import os
+from pathlib import Path
+
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+from lazyclaude.services.json_cache import JsonFileCache
+
+
+class TestLoad:
+    """Tests for load method."""
+
+    def test_returns_parsed_data(self, fs: FakeFilesystem) -> None:
+        """Valid JSON is parsed and returned."""
+        path = Path("/data/settings.json")
+        fs.create_file(path, contents=json.dumps({"hooks": {}}))
+
+        assert JsonFileCache().load(path) == {"hooks": {}}
+
+    def test_reuses_data_while_unchanged(self, fs: FakeFilesystem) -> None:
+        """A second load of an unchanged file returns the same object."""
+        path = Path("/data/settings.json")
+        fs.create_file(path, contents=json.dumps({"a": 1}))
+        cache = JsonFileCache()
+
+        assert cache.load(path) is cache.load(path)
+
+    def test_reloads_after_change(self, fs: FakeFilesystem) -> None:
+        """A rewritten file is parsed again."""
+        path = Path("/data/settings.json")
+        fs.create_file(path, contents=json.dumps({"a": 1}))
+        cache = JsonFileCache()
+        cache.load(path)
+
+        path.write_text(json.dumps({"a": 22}), encoding="utf-8")
+        os.utime(path, ns=(1, 1))
+
+        assert cache.load(path) == {"a": 22}
+
+    def test_returns_none_for_missing_or_invalid(self, fs: FakeFilesystem) -> None:
+        """Missing files and invalid JSON both yield None."""
+        path = Path("/data/broken.json")
+        fs.create_file(path, contents="not valid json {{{")
+        cache = JsonFileCache()
+
+        assert cache.load(path) is None
+        assert cache.load(Path("/data/missing.json")) is None
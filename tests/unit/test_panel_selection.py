@@ -0,0 +1,132 @@
+"""Tests for panel selection messages reaching the main pane."""
+
+from pathlib import Path
+
+import pytest
+
+from lazyclaude.app import LazyClaude, create_app
+from lazyclaude.widgets.combined_panel import CombinedPanel
+from lazyclaude.widgets.detail_pane import MainPane
+from lazyclaude.widgets.type_panel import TypePanel
+
+
+@pytest.fixture
+def app(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> LazyClaude:
+    """Create an app over a small user config with two items per panel."""
+    home = tmp_path / "home"
+    user_claude = home / ".claude"
+    for subdir, names in (("commands", "ab"), ("agents", "ab")):
+        (user_claude / subdir).mkdir(parents=True)
+        for name in names:
+            (user_claude / subdir / f"{subdir}_{name}.md").write_text(
+                f"---\ndescription: {subdir} {name}\n---\n"
+            )
+    (user_claude / "CLAUDE.md").write_text("# User memory\n")
+    (user_claude / "AGENTS.md").write_text("# User agents\n")
+    monkeypatch.setattr(Path, "home", lambda: home)
+    return create_app(
+        user_config_path=user_claude,
+        project_config_path=tmp_path / "project" / ".claude",
+    )
+
+
+def _shown(app: LazyClaude) -> str | None:
+    """Name of the customization the main pane displays."""
+    customization = app.query_one(MainPane).customization
+    return customization.name if customization else None
+
+
+class TestPendingSelectionAfterPanelSwitch:
+    """A cursor move just before switching panels must not win the main pane."""
+
+    async def test_type_panel(self, app: LazyClaude) -> None:
+        """Moving in the commands panel then focusing agents shows the agent."""
+        async with app.run_test() as pilot:
+            await pilot.press("1")
+            await pilot.pause()
+
+            # Back to back, so the move's deferred announcement is still pending.
+            app.query_one("#panel-slash_command", TypePanel).action_cursor_down()
+            app.action_focus_panel(2)
+            await pilot.pause(0.2)
+
+            assert _shown(app) == "agents_a"
+
+    async def test_combined_panel(self, app: LazyClaude) -> None:
+        """Moving in the memory tab then focusing commands shows the command."""
+        async with app.run_test() as pilot:
+            await pilot.press("4")
+            await pilot.pause()
+
+            app.query_one(CombinedPanel).action_cursor_down()
+            app.action_focus_panel(1)
+            await pilot.pause(0.2)
+
+            assert _shown(app) == "commands_a"
+
+
+class TestSettledSelection:
+    """A burst of cursor moves announces where the cursor stops."""
+
+    async def test_burst_announces_final_row(self, app: LazyClaude) -> None:
+        """Rapid moves in a focused panel end on the last selected item."""
+        async with app.run_test() as pilot:
+            await pilot.press("1")
+            await pilot.pause()
+
+            panel = app.query_one("#panel-slash_command", TypePanel)
+            panel.action_cursor_down()
+            panel.action_cursor_up()
+            panel.action_cursor_down()
+            await pilot.pause(0.2)
+
+            assert _shown(app) == "commands_b"
+
+
+class TestFocusedPanelIndex:
+    """The focused panel index stays right while focus events are in flight."""
+
+    async def test_index_follows_focus_before_event_arrives(
+        self, app: LazyClaude
+    ) -> None:
+        """A lookup right after a focus change sees the new panel."""
+        async with app.run_test() as pilot:
+            await pilot.press("1")
+            await pilot.pause()
+            assert app._get_focused_panel_index() == 0
+
+            # DescendantFocus reaches the app later, so the cache is stale here.
+            app.screen.set_focus(app.query_one(CombinedPanel))
+            assert app._get_focused_panel_index() == 3
+
+            await pilot.pause()
+            assert app._focused_panel_index == 3
+
+
+class TestPendingSelectionAfterLeavingPanels:
+    """A cursor move just before focusing the main pane still reaches it."""
+
+    async def test_type_panel(self, app: LazyClaude) -> None:
+        """Moving in the commands panel then focusing the main pane shows the move."""
+        async with app.run_test() as pilot:
+            await pilot.press("1")
+            await pilot.pause()
+
+            app.query_one("#panel-slash_command", TypePanel).action_cursor_down()
+            app.action_focus_main_pane()
+            await pilot.pause(0.2)
+
+            assert _shown(app) == "commands_b"
+
+    async def test_combined_panel(self, app: LazyClaude) -> None:
+        """Moving in the memory tab then focusing the main pane shows the move."""
+        async with app.run_test() as pilot:
+            await pilot.press("4")
+            await pilot.pause()
+            assert _shown(app) == "AGENTS.md"
+
+            app.query_one(CombinedPanel).action_cursor_down()
+            app.action_focus_main_pane()
+            await pilot.pause(0.2)
+
+            assert _shown(app) == "CLAUDE.md"
@@ -298,3 +298,38 @@ class TestGetPluginSourcePath:
         result = loader.get_plugin_source_path("test@local")
 
         assert result == Path("/dev/local")
+
+    def test_source_path_is_kept_until_refresh(self, fs: FakeFilesystem) -> None:
+        """Resolved source paths are reused until the loader is refreshed."""
+        user_config = Path("/home/user/.claude")
+        fs.create_dir(user_config / "plugins")
+
+        fs.create_file(
+            user_config / "plugins" / "known_marketplaces.json",
+            contents=json.dumps(
+                {"local": {"source": {"source": "directory", "path": "/dev/local"}}}
+            ),
+        )
+        marketplace_json = Path("/dev/local/.claude-plugin/marketplace.json")
+        fs.create_file(
+            marketplace_json,
+            contents=json.dumps(
+                {"plugins": [{"name": "test", "source": "./plugins/test"}]}
+            ),
+        )
+        fs.create_dir("/dev/local/plugins/test")
+        fs.create_dir("/dev/local/plugins/moved")
+
+        loader = PluginLoader(user_config)
+        first = loader.get_plugin_source_path("test@local")
+
+        marketplace_json.write_text(
+            json.dumps({"plugins": [{"name": "test", "source": "./plugins/moved"}]}),
+            encoding="utf-8",
+        )
+        cached = loader.get_plugin_source_path("test@local")
+        loader.refresh()
+        refreshed = loader.get_plugin_source_path("test@local")
+
+        assert first == cached == Path("/dev/local/plugins/test")
+        assert refreshed == Path("/dev/local/plugins/moved")